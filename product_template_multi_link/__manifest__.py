@@ -4,7 +4,7 @@
 
 {
     "name": "Product Multi Links (Template)",
-    "version": "14.0.1.3.0",
+    "version": "14.0.1.6.0",
     "category": "Generic Modules",
     "author": "GRAP, ACSONE SA/NV, Odoo Community Association (OCA)",
     "website": "https://github.com/OCA/e-commerce",
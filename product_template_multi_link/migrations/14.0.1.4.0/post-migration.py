@@ -0,0 +1,14 @@
+# License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl).
+
+
+def migrate(cr, version):
+    """Fill the links relation table of the templates with the existing links."""
+    cr.execute(
+        """
+        INSERT INTO product_template_link_adjacency_rel (product_tmpl_id, link_id)
+        SELECT left_product_tmpl_id, id FROM product_template_link
+        UNION
+        SELECT right_product_tmpl_id, id FROM product_template_link
+        ON CONFLICT DO NOTHING
+        """
+    )
@@ -2,8 +2,6 @@
 # @author Sylvain LE GAL <https://twitter.com/legalsylvain>
 # License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl).
 
-from collections import defaultdict
-
 from odoo import _, api, fields, models
 from odoo.exceptions import AccessError
 from odoo.osv import expression
@@ -12,33 +10,23 @@ from odoo.osv import expression
 class ProductTemplate(models.Model):
     _inherit = "product.template"
 
-    product_template_link_ids = fields.One2many(
+    # Both sides of each link are stored in the relation table, so the links
+    # of a template are read by template without searching on both columns.
+    # The table is filled by the links, see ``product.template.link``.
+    product_template_link_ids = fields.Many2many(
         string="Product Links",
         comodel_name="product.template.link",
-        compute="_compute_product_link_ids",
+        relation="product_template_link_adjacency_rel",
+        column1="product_tmpl_id",
+        column2="link_id",
+        readonly=True,
+        copy=False,
     )
 
     product_template_link_count = fields.Integer(
         string="Product Links Count", compute="_compute_product_template_link_count"
     )
 
-    def _compute_product_link_ids(self):
-        link_model = self.env["product.template.link"]
-        domain = [
-            "|",
-            ("left_product_tmpl_id", "in", self.ids),
-            ("right_product_tmpl_id", "in", self.ids),
-        ]
-        links = link_model.search(domain)
-        links_by_product_id = defaultdict(set)
-        for link in links:
-            links_by_product_id[link.left_product_tmpl_id.id].add(link.id)
-            links_by_product_id[link.right_product_tmpl_id.id].add(link.id)
-        for record in self:
-            record.product_template_link_ids = self.env["product.template.link"].browse(
-                list(links_by_product_id[record.id])
-            )
-
     @api.depends("product_template_link_ids")
     def _compute_product_template_link_count(self):
         link_model = self.env["product.template.link"]
@@ -50,33 +38,7 @@ class ProductTemplate(models.Model):
                 rec.product_template_link_count = 0
             return
 
-        domain = [
-            "|",
-            ("left_product_tmpl_id", "in", self.ids),
-            ("right_product_tmpl_id", "in", self.ids),
-        ]
-
-        res_1 = link_model.read_group(
-            domain=domain,
-            fields=["left_product_tmpl_id"],
-            groupby=["left_product_tmpl_id"],
-        )
-        res_2 = link_model.read_group(
-            domain=domain,
-            fields=["right_product_tmpl_id"],
-            groupby=["right_product_tmpl_id"],
-        )
-
-        link_dict = {}
-        for dic in res_1:
-            link_id = dic["left_product_tmpl_id"][0]
-            link_dict.setdefault(link_id, 0)
-            link_dict[link_id] += dic["left_product_tmpl_id_count"]
-        for dic in res_2:
-            link_id = dic["right_product_tmpl_id"][0]
-            link_dict.setdefault(link_id, 0)
-            link_dict[link_id] += dic["right_product_tmpl_id_count"]
-
+        link_dict = link_model._get_template_link_count(self.ids)
         for rec in self:
             rec.product_template_link_count = link_dict.get(rec.id, 0)
 
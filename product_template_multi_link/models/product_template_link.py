@@ -1,12 +1,13 @@
 # Copyright 2017-Today GRAP (http://www.grap.coop).
 # @author Sylvain LE GAL <https://twitter.com/legalsylvain>
 # License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl).
-from contextlib import contextmanager
+from collections import Counter
 
+import psycopg2
 from psycopg2.extensions import AsIs
 
-from odoo import _, api, fields, models
-from odoo.exceptions import ValidationError
+from odoo import _, api, fields, models, tools
+from odoo.exceptions import UserError, ValidationError
 
 
 class ProductTemplateLink(models.Model):
@@ -46,107 +47,149 @@ class ProductTemplateLink(models.Model):
         for record in self:
             record.is_link_active = True
 
+    def init(self):
+        # Only one link of each type between the same products, whatever
+        # their sides. The modules changing the key replace the indexes.
+        if self._is_link_extended():
+            return
+        self._create_link_unique_indexes(self._get_link_unique_indexes())
+
+    def _create_link_unique_indexes(self, indexes):
+        """Create the given unique indexes and drop the other ones of the
+        links modules.
+
+        :param indexes: dict as returned by _get_link_unique_indexes
+        :raise: UserError if the existing links are duplicated
+        """
+        for index_name in self._get_link_unique_index_names() - set(indexes):
+            self._cr.execute('DROP INDEX IF EXISTS "{}"'.format(index_name))
+        for index_name, (expressions, where_clause) in indexes.items():
+            if tools.index_exists(self._cr, index_name):
+                continue
+            try:
+                self._cr.execute(
+                    'CREATE UNIQUE INDEX "{}" ON "{}" ({}) {}'.format(
+                        index_name,
+                        self._table,
+                        ", ".join(expressions),
+                        where_clause and "WHERE {}".format(where_clause) or "",
+                    )
+                )
+            except psycopg2.IntegrityError as error:
+                raise UserError(
+                    _(
+                        "Unable to create the index %s, the duplicated product "
+                        "links must be removed first.\n%s"
+                    )
+                    % (index_name, error.diag.message_detail)
+                ) from error
+
+    def _is_link_extended(self):
+        """Whether the links are extended by modules not loaded yet, as when
+        the modules are updated: their init creates the indexes of their key.
+        """
+        self._cr.execute(
+            "SELECT name FROM ir_model_fields WHERE model = %s AND state = 'base'",
+            (self._name,),
+        )
+        return any(name not in self._fields for (name,) in self._cr.fetchall())
+
+    def _get_link_unique_indexes(self):
+        """Unique indexes preventing duplicated links.
+
+        :return: dict mapping the index names to a tuple with the list of the
+            indexed expressions and the WHERE clause of the index, if any
+        """
+        return {
+            "{}_unique_pair_index".format(self._table): (
+                [
+                    "LEAST(left_product_tmpl_id, right_product_tmpl_id)",
+                    "GREATEST(left_product_tmpl_id, right_product_tmpl_id)",
+                    "type_id",
+                ],
+                None,
+            )
+        }
+
+    def _get_link_unique_index_names(self):
+        """Names of all the unique indexes of the links modules, the ones not
+        returned by _get_link_unique_indexes are dropped.
+
+        :return: set
+        """
+        return {"{}_unique_pair_index".format(self._table)}
+
+    def _get_link_unique_fields(self):
+        """Fields of the links in the unique indexes.
+
+        :return: list of field names
+        """
+        return ["left_product_tmpl_id", "right_product_tmpl_id", "type_id"]
+
+    def _get_link_unique_key(self):
+        """Key of the link in the unique indexes, whatever the products sides.
+
+        :return: tuple
+        """
+        left, right = self.left_product_tmpl_id.id, self.right_product_tmpl_id.id
+        return (min(left, right), max(left, right), self.type_id.id)
+
     @api.constrains("left_product_tmpl_id", "right_product_tmpl_id", "type_id")
     def _check_products(self):
         """Verify links between products.
 
-        Check whether:
-            - the two products are different
-            - there is only one link between the same two templates for the same type
+        Check whether the two products are different. The duplicated links
+        are prevented by the unique indexes, see _raise_duplicate_link_error.
 
         :raise: ValidationError if not ok
         """
-        self.flush()  # flush required since the method uses plain sql
         if any(rec._check_product_not_different() for rec in self):
             raise ValidationError(
                 _("You can only create a link between 2 different products")
             )
 
-        products = self.mapped("left_product_tmpl_id") + self.mapped(
-            "right_product_tmpl_id"
-        )
-        query, query_args = self._check_products_query(products)
-        self.env.cr.execute(query, query_args)
-        res = self.env.cr.fetchall()
-        is_duplicate_by_link_id = dict(res)
-        if True in is_duplicate_by_link_id.values():
-            ids = [k for k, v in is_duplicate_by_link_id.items() if v]
-            descrs = "\n ".join(
-                [link._duplicate_link_error_msg() for link in self.browse(ids)]
-            )
-            raise ValidationError(
-                _(
-                    "Only one link with the same type is allowed between 2 "
-                    "products. \n %s"
-                )
-                % descrs
-            )
-
     def _check_product_not_different(self):
         return self.left_product_tmpl_id == self.right_product_tmpl_id
 
-    def _check_products_query(self, products):
-        query = """
-            SELECT
-                id,
-                l2.duplicate or l3.duplicate
-            FROM (
-                SELECT
-                    {main_select_columns}
-                FROM
-                    %s
-                WHERE
-                    left_product_tmpl_id in %s
-                    AND right_product_tmpl_id in %s
-            ) as l1
-            LEFT JOIN LATERAL (
-                SELECT
-                    TRUE as duplicate
-                FROM
-                    %s
-                WHERE
-                    {l2_join_where_clause}
-            ) l2 ON TRUE
-            LEFT JOIN LATERAL (
-                SELECT
-                    TRUE as duplicate
-                FROM
-                    %s
-                WHERE
-                    {l3_join_where_clause}
-            ) l3 ON TRUE
-        """.format(
-            **self._check_products_query_params()
-        )
-        query_args = (
-            AsIs(self._table),
-            tuple(products.ids),
-            tuple(products.ids),
-            AsIs(self._table),
-            AsIs(self._table),
+    @api.model
+    def _raise_duplicate_link_error(self, error, links):
+        """Explain which links are duplicated when they break a unique index.
+
+        :param error: psycopg2.IntegrityError raised when saving the links
+        :param links: list of product.template.link new records, with the
+            values of the saved links
+        :raise: ValidationError if the error comes from a unique index
+        """
+        if error.diag.constraint_name not in self._get_link_unique_indexes():
+            return
+        keys = [link._get_link_unique_key() for link in links]
+        template_ids = {link.left_product_tmpl_id.id for link in links} | {
+            link.right_product_tmpl_id.id for link in links
+        }
+        existing_links = self.search(
+            [
+                ("id", "not in", [link._origin.id for link in links if link._origin]),
+                ("left_product_tmpl_id", "in", list(template_ids)),
+                ("right_product_tmpl_id", "in", list(template_ids)),
+            ]
         )
-        return query, query_args
-
-    def _check_products_query_params(self):
-        return dict(
-            main_select_columns="""
-                id,
-                left_product_tmpl_id,
-                right_product_tmpl_id,
-                type_id
-            """,
-            l2_join_where_clause="""
-            right_product_tmpl_id = l1.left_product_tmpl_id
-            AND left_product_tmpl_id = l1.right_product_tmpl_id
-            AND type_id = l1.type_id
-        """,
-            l3_join_where_clause="""
-            left_product_tmpl_id = l1.left_product_tmpl_id
-            AND right_product_tmpl_id = l1.right_product_tmpl_id
-            AND type_id = l1.type_id
-            AND id != l1.id
-        """,
+        existing_keys = {link._get_link_unique_key() for link in existing_links}
+        key_counts = Counter(keys)
+        duplicates = [
+            link
+            for link, key in zip(links, keys)
+            if key in existing_keys or key_counts[key] > 1
+        ]
+        descrs = "\n ".join(
+            link._duplicate_link_error_msg() for link in duplicates or links
         )
+        raise ValidationError(
+            _(
+                "Only one link with the same type is allowed between 2 "
+                "products. \n %s"
+            )
+            % descrs
+        ) from error
 
     def _duplicate_link_error_msg(self):
         return "{} <-> {} / {} <-> {}".format(
@@ -156,19 +199,186 @@ class ProductTemplateLink(models.Model):
             self.right_product_tmpl_id.name,
         )
 
-    @contextmanager
-    def _invalidate_links_on_product_template(self):
-        yield
-        self._invalidate_links()
+    @api.model
+    def _get_link_count(self, left_field, right_field, ids):
+        """Count the links of each record in one query, as the records can be
+        on any side of their links.
+
+        :param left_field: name of the link field with the left side records
+        :param right_field: name of the link field with the right side records
+        :param ids: ids of the records to count
+        :return: dict mapping the ids to their number of links
+        """
+        ids = [record_id for record_id in ids if isinstance(record_id, int)]
+        res = dict.fromkeys(ids, 0)
+        if not ids:
+            return res
+        self.flush([left_field, right_field])
+        query = self._where_calc([])
+        self._apply_ir_rules(query, "read")
+        from_clause, where_clause, where_params = query.get_sql()
+        rules_clause = where_clause and "AND ({})".format(where_clause) or ""
+        self.env.cr.execute(
+            """
+            SELECT side_id, COUNT(*)
+            FROM (
+                SELECT "{table}".{left} AS side_id
+                FROM {from_clause}
+                WHERE "{table}".{left} IN %s {rules_clause}
+                UNION ALL
+                SELECT "{table}".{right} AS side_id
+                FROM {from_clause}
+                WHERE "{table}".{right} IN %s {rules_clause}
+            ) AS sides
+            GROUP BY side_id
+            """.format(
+                table=self._table,
+                left=left_field,
+                right=right_field,
+                from_clause=from_clause,
+                rules_clause=rules_clause,
+            ),
+            [tuple(ids)] + where_params + [tuple(ids)] + where_params,
+        )
+        res.update(self.env.cr.fetchall())
+        return res
+
+    @api.model
+    def _get_template_link_count(self, template_ids):
+        """Count the links of each template from the relation table holding
+        both sides of the links, with one GROUP BY on its primary key.
 
-    def _invalidate_links(self):
-        self.env["product.template"].invalidate_cache(["product_template_link_ids"])
+        When record rules apply on the links, the links are counted from
+        their own table, see ``_get_link_count``, as the rules must be applied
+        on it anyway.
+
+        :param template_ids: ids of the templates to count
+        :return: dict mapping the ids to their number of links
+        """
+        query = self._where_calc([])
+        self._apply_ir_rules(query, "read")
+        if query.get_sql()[1]:
+            return self._get_link_count(
+                "left_product_tmpl_id", "right_product_tmpl_id", template_ids
+            )
+        ids = [tmpl_id for tmpl_id in template_ids if isinstance(tmpl_id, int)]
+        res = dict.fromkeys(ids, 0)
+        if not ids:
+            return res
+        self.flush(["left_product_tmpl_id", "right_product_tmpl_id"])
+        self.env.cr.execute(
+            """
+            SELECT product_tmpl_id, COUNT(*)
+            FROM product_template_link_adjacency_rel
+            WHERE product_tmpl_id IN %s
+            GROUP BY product_tmpl_id
+            """,
+            (tuple(ids),),
+        )
+        res.update(self.env.cr.fetchall())
+        return res
+
+    def _get_link_templates(self):
+        return self.mapped("left_product_tmpl_id") | self.mapped(
+            "right_product_tmpl_id"
+        )
+
+    def _invalidate_links(self, templates):
+        """Invalidate the cached links of the given templates and their
+        variants, instead of the links of all the templates.
+        """
+        self.env["product.template"].invalidate_cache(
+            ["product_template_link_ids", "product_template_link_count"],
+            templates.ids,
+        )
+        variants = templates.with_context(active_test=False).product_variant_ids
+        self.env["product.product"].invalidate_cache(
+            ["product_template_link_ids", "product_template_link_count"],
+            variants.ids,
+        )
+
+    @api.model
+    def _remove_links(self, templates, link_types=None, between=False):
+        """Delete the links of the given templates.
+
+        The links are found by a single search on both sides and unlinked at
+        once, instead of reading the links of each template.
+
+        :param templates: product.template recordset
+        :param link_types: product.template.link.type recordset, to only
+            remove the links of these types
+        :param between: only remove the links between the given templates,
+            instead of every link where one of them is on any side
+        :return: number of deleted links
+        """
+        if not templates:
+            return 0
+        left = ("left_product_tmpl_id", "in", templates.ids)
+        right = ("right_product_tmpl_id", "in", templates.ids)
+        domain = [left, right] if between else ["|", left, right]
+        if link_types:
+            domain.append(("type_id", "in", link_types.ids))
+        links = self.search(domain)
+        links.unlink()
+        return len(links)
+
+    def _update_link_adjacency(self):
+        """Store both sides of the links in the templates relation table."""
+        if not self:
+            return
+        self.flush(["left_product_tmpl_id", "right_product_tmpl_id"])
+        self.env.cr.execute(
+            "DELETE FROM product_template_link_adjacency_rel WHERE link_id IN %s",
+            (tuple(self.ids),),
+        )
+        self.env.cr.execute(
+            """
+            INSERT INTO product_template_link_adjacency_rel (product_tmpl_id, link_id)
+            SELECT left_product_tmpl_id, id FROM %(table)s WHERE id IN %(ids)s
+            UNION
+            SELECT right_product_tmpl_id, id FROM %(table)s WHERE id IN %(ids)s
+            """,
+            {"table": AsIs(self._table), "ids": tuple(self.ids)},
+        )
 
     @api.model_create_multi
     def create(self, vals_list):
-        with self._invalidate_links_on_product_template():
-            return super().create(vals_list)
+        # Only the links are saved in the savepoint, so that a duplicated
+        # link does not clear the pending changes of the environment.
+        self.flush(self._get_link_unique_fields())
+        try:
+            with self.env.cr.savepoint(flush=False):
+                links = super().create(vals_list)
+                links.flush(self._get_link_unique_fields(), links)
+        except psycopg2.IntegrityError as error:
+            self._raise_duplicate_link_error(
+                error, [self.new(vals) for vals in vals_list]
+            )
+            raise
+        links._update_link_adjacency()
+        links._invalidate_links(links._get_link_templates())
+        return links
 
     def write(self, vals):
-        with self._invalidate_links_on_product_template():
-            return super().write(vals)
+        templates = self._get_link_templates()
+        self.flush(self._get_link_unique_fields())
+        try:
+            with self.env.cr.savepoint(flush=False):
+                res = super().write(vals)
+                self.flush(self._get_link_unique_fields(), self)
+        except psycopg2.IntegrityError as error:
+            self._raise_duplicate_link_error(
+                error, [self.new(vals, origin=link) for link in self]
+            )
+            raise
+        if "left_product_tmpl_id" in vals or "right_product_tmpl_id" in vals:
+            self._update_link_adjacency()
+        self._invalidate_links(templates | self._get_link_templates())
+        return res
+
+    def unlink(self):
+        # The relation table rows are deleted in cascade with the links
+        templates = self._get_link_templates()
+        res = super().unlink()
+        self._invalidate_links(templates)
+        return res
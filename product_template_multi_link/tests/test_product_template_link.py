@@ -1,8 +1,12 @@
 # Copyright 2019 ACSONE SA/NV
 # License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl).
+import re
 
-from odoo.exceptions import ValidationError
+from psycopg2 import IntegrityError
+
+from odoo.exceptions import UserError, ValidationError
 from odoo.tests.common import SavepointCase
+from odoo.tools import mute_logger
 
 
 class TestProductTemplateLink(SavepointCase):
@@ -25,6 +29,7 @@ class TestProductTemplateLink(SavepointCase):
             "product_template_multi_link.product_template_link_type_cross_selling"
         )
 
+    @mute_logger("odoo.sql_db")
     def test_01(self):
         """
         Data:
@@ -54,6 +59,67 @@ class TestProductTemplateLink(SavepointCase):
                 }
             )
 
+    @mute_logger("odoo.sql_db")
+    def test_unique_index(self):
+        """The duplicated links are rejected by the database, and explained
+        when saved through the ORM."""
+        link1, link2 = self.ProductTemplateLink.create(
+            [
+                {
+                    "left_product_tmpl_id": self.product_product_1.id,
+                    "right_product_tmpl_id": self.product_product_2.id,
+                    "type_id": self.link_type.id,
+                },
+                {
+                    "left_product_tmpl_id": self.product_product_1.id,
+                    "right_product_tmpl_id": self.product_product_2.id,
+                    "type_id": self.env.ref(
+                        "product_template_multi_link."
+                        "product_template_link_type_up_selling"
+                    ).id,
+                },
+            ]
+        )
+        with self.assertRaises(IntegrityError), self.env.cr.savepoint():
+            self.env.cr.execute(
+                """
+                INSERT INTO product_template_link
+                    (left_product_tmpl_id, right_product_tmpl_id, type_id)
+                VALUES (%s, %s, %s)
+                """,
+                (
+                    self.product_product_2.id,
+                    self.product_product_1.id,
+                    self.link_type.id,
+                ),
+            )
+        with self.assertRaisesRegex(
+            ValidationError, re.escape(link1._duplicate_link_error_msg())
+        ), self.env.cr.savepoint():
+            link2.type_id = self.link_type
+
+    @mute_logger("odoo.sql_db")
+    def test_unique_index_duplicates(self):
+        """The unique indexes are not created over duplicated links."""
+        for index_name in self.ProductTemplateLink._get_link_unique_indexes():
+            self.env.cr.execute('DROP INDEX "{}"'.format(index_name))
+        self.env.cr.execute(
+            """
+            INSERT INTO product_template_link
+                (left_product_tmpl_id, right_product_tmpl_id, type_id)
+            VALUES (%(left)s, %(right)s, %(type)s), (%(right)s, %(left)s, %(type)s)
+            """,
+            {
+                "left": self.product_product_1.id,
+                "right": self.product_product_2.id,
+                "type": self.link_type.id,
+            },
+        )
+        with self.assertRaisesRegex(
+            UserError, "duplicated product links"
+        ), self.env.cr.savepoint():
+            self.ProductTemplateLink.init()
+
     def test_02(self):
         """
         Data:
@@ -124,3 +190,65 @@ class TestProductTemplateLink(SavepointCase):
         self.assertFalse(self.product_product_2.product_template_link_ids)
         self.assertEqual(0, self.product_product_1.product_template_link_count)
         self.assertEqual(0, self.product_product_2.product_template_link_count)
+
+    def test_links_adjacency(self):
+        """The links are stored for both templates and only the templates of
+        the changed links are updated."""
+        template_1 = self.product_product_1.product_tmpl_id
+        template_2 = self.product_product_2.product_tmpl_id
+        template_3 = self.env.ref("product.product_product_3").product_tmpl_id
+        link1 = self.ProductTemplateLink.create(
+            {
+                "left_product_tmpl_id": template_1.id,
+                "right_product_tmpl_id": template_2.id,
+                "type_id": self.link_type.id,
+            }
+        )
+        self.assertIn(link1, template_1.product_template_link_ids)
+        self.assertIn(link1, template_2.product_template_link_ids)
+        self.assertNotIn(link1, template_3.product_template_link_ids)
+        link1.right_product_tmpl_id = template_3
+        self.assertIn(link1, template_1.product_template_link_ids)
+        self.assertNotIn(link1, template_2.product_template_link_ids)
+        self.assertIn(link1, template_3.product_template_link_ids)
+        self.env.cr.execute(
+            "SELECT product_tmpl_id FROM product_template_link_adjacency_rel "
+            "WHERE link_id = %s",
+            (link1.id,),
+        )
+        self.assertEqual(
+            {row[0] for row in self.env.cr.fetchall()}, {template_1.id, template_3.id}
+        )
+
+    def test_template_link_count(self):
+        """The links counted from the relation table are the links counted on
+        both sides of the link table."""
+        template_1 = self.product_product_1.product_tmpl_id
+        template_2 = self.product_product_2.product_tmpl_id
+        template_3 = self.env.ref("product.product_product_3").product_tmpl_id
+        templates = template_1 | template_2 | template_3
+        link1, link2 = self.ProductTemplateLink.create(
+            [
+                {
+                    "left_product_tmpl_id": template_1.id,
+                    "right_product_tmpl_id": template_2.id,
+                    "type_id": self.link_type.id,
+                },
+                {
+                    "left_product_tmpl_id": template_3.id,
+                    "right_product_tmpl_id": template_1.id,
+                    "type_id": self.link_type.id,
+                },
+            ]
+        )
+        link2.left_product_tmpl_id = template_2
+        counts = self.ProductTemplateLink._get_template_link_count(templates.ids)
+        self.assertEqual(
+            counts,
+            self.ProductTemplateLink._get_link_count(
+                "left_product_tmpl_id", "right_product_tmpl_id", templates.ids
+            ),
+        )
+        self.assertEqual(counts[template_1.id], 2)
+        self.assertEqual(counts[template_2.id], 2)
+        self.assertEqual(counts[template_3.id], 0)
@@ -1,5 +1,7 @@
 # Copyright 2020 ACSONE SA/NV (<http://acsone.eu>)
 # License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl.html).
+from unittest import mock
+
 from odoo.tests.common import SavepointCase
 
 
@@ -110,6 +112,20 @@ class TestProductTemplateLinker(SavepointCase):
         # 2 because we have up_sell and cross_sell
         self.assertEqual(2, len(link))
 
+    def test_wizard_link_single_create(self):
+        link_type = self.cross_sell
+        wizard = self._launch_wizard(
+            self.products, operation_type="link", link_type=link_type
+        )
+        link_model = type(self.product_link_obj)
+        with mock.patch.object(
+            link_model, "create", autospec=True, side_effect=link_model.create
+        ) as mock_create:
+            links = wizard.action_apply_link()
+        mock_create.assert_called_once()
+        self.assertEqual(len(links), 3)
+        self._test_link_created(links, link_type)
+
     def test_wizard_unlink(self):
         wizard = self._launch_wizard(self.products, operation_type="unlink")
         self.product_link_obj.create(
@@ -128,3 +144,55 @@ class TestProductTemplateLinker(SavepointCase):
         )
         wizard.action_apply_unlink()
         self.assertFalse(self.product1.product_template_link_ids)
+
+    def test_wizard_unlink_type(self):
+        self.product_link_obj.create(
+            [
+                {
+                    "left_product_tmpl_id": self.product1.id,
+                    "right_product_tmpl_id": self.product2.id,
+                    "type_id": self.up_sell.id,
+                },
+                {
+                    "left_product_tmpl_id": self.product1.id,
+                    "right_product_tmpl_id": self.product3.id,
+                    "type_id": self.cross_sell.id,
+                },
+            ]
+        )
+        self.assertEqual(len(self.product1.product_template_link_ids), 2)
+        wizard = self._launch_wizard(
+            self.product1 | self.product2,
+            operation_type="unlink",
+            link_type=self.up_sell,
+        )
+        wizard.action_apply_unlink()
+        links = self.product1.product_template_link_ids
+        self.assertEqual(links.type_id, self.cross_sell)
+        self.assertEqual(links.right_product_tmpl_id, self.product3)
+        self.assertFalse(self.product2.product_template_link_ids)
+        self.assertEqual(self.product1.product_template_link_count, 1)
+
+    def test_remove_links_between(self):
+        self.product_link_obj.create(
+            [
+                {
+                    "left_product_tmpl_id": self.product1.id,
+                    "right_product_tmpl_id": self.product2.id,
+                    "type_id": self.up_sell.id,
+                },
+                {
+                    "left_product_tmpl_id": self.product1.id,
+                    "right_product_tmpl_id": self.product3.id,
+                    "type_id": self.up_sell.id,
+                },
+            ]
+        )
+        removed = self.product_link_obj._remove_links(
+            self.product1 | self.product2, between=True
+        )
+        self.assertEqual(removed, 1)
+        self.assertEqual(
+            self.product1.product_template_link_ids.right_product_tmpl_id,
+            self.product3,
+        )
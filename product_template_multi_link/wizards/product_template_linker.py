@@ -19,7 +19,7 @@ class ProductTemplateLinker(models.TransientModel):
         string="Operation",
         required=True,
         help="Remove existing links: will remove every existing link "
-        "on each selected products;\n"
+        "on each selected products, only of the link type if set;\n"
         "Link these products: will link all selected "
         "products together.",
     )
@@ -65,25 +65,59 @@ class ProductTemplateLinker(models.TransientModel):
 
         :return: product.template.link recordset
         """
-        self.product_ids.mapped("product_template_link_ids").unlink()
+        self.ensure_one()
+        self.env["product.template.link"]._remove_links(
+            self.product_ids, link_types=self.type_id
+        )
         return self.env["product.template.link"].browse()
 
     def action_apply_link(self):
         """Add link to products.
 
+        The missing links between all the products are created at once, so
+        the links constraints are checked only once for all of them.
+
         :return: product.template.link recordset
         """
-        links = self.env["product.template.link"].browse()
-        for product in self.product_ids:
-            existing_links = product.product_template_link_ids.filtered(
-                lambda l: l.type_id == self.type_id
+        self.ensure_one()
+        products = self.product_ids
+        existing_links = self.env["product.template.link"].search_read(
+            [
+                ("type_id", "=", self.type_id.id),
+                ("left_product_tmpl_id", "in", products.ids),
+                ("right_product_tmpl_id", "in", products.ids),
+            ],
+            ["left_product_tmpl_id", "right_product_tmpl_id"],
+        )
+        linked_pairs = {
+            frozenset(
+                (link["left_product_tmpl_id"][0], link["right_product_tmpl_id"][0])
             )
-            linked_products = existing_links.mapped(
-                "left_product_tmpl_id"
-            ) | existing_links.mapped("right_product_tmpl_id")
-            products_to_link = self.product_ids - linked_products - product
-            links |= self._create_link(product, products_to_link)
-        return links
+            for link in existing_links
+        }
+        vals_list = []
+        for index, product_source in enumerate(products):
+            for target_product in products[index + 1 :]:
+                if frozenset((product_source.id, target_product.id)) in linked_pairs:
+                    continue
+                vals_list.append(
+                    self._prepare_link_values(product_source, target_product)
+                )
+        return self.env["product.template.link"].create(vals_list)
+
+    def _prepare_link_values(self, product_source, target_product):
+        """Values for creating the link between the given products.
+
+        :param product_source: product.template record
+        :param target_product: product.template record
+        :return: dict
+        """
+        self.ensure_one()
+        return {
+            "left_product_tmpl_id": product_source.id,
+            "right_product_tmpl_id": target_product.id,
+            "type_id": self.type_id.id,
+        }
 
     def _create_link(self, product_source, target_products):
         """Create the link between given product source and target products.
@@ -93,13 +127,9 @@ class ProductTemplateLinker(models.TransientModel):
         :return: product.template.link recordset
         """
         self.ensure_one()
-        prod_link_obj = self.env["product.template.link"]
-        product_links = prod_link_obj.browse()
-        for target_product in target_products:
-            values = {
-                "left_product_tmpl_id": product_source.id,
-                "right_product_tmpl_id": target_product.id,
-                "type_id": self.type_id.id,
-            }
-            product_links |= prod_link_obj.create(values)
-        return product_links
+        return self.env["product.template.link"].create(
+            [
+                self._prepare_link_values(product_source, target_product)
+                for target_product in target_products
+            ]
+        )
@@ -0,0 +1,12 @@
+# Copyright 2026 Camptocamp SA (http://www.camptocamp.com)
+# License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl).
+from odoo import SUPERUSER_ID, api
+
+
+def uninstall_hook(cr, registry):
+    # The indexes of the variants are dropped with their columns, restore the
+    # one of the templates as it is only created when the base module is
+    # updated.
+    env = api.Environment(cr, SUPERUSER_ID, {})
+    links = env["product.template.link"]
+    links._create_link_unique_indexes(links._get_link_template_unique_indexes())
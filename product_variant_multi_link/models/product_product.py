@@ -29,33 +29,9 @@ class ProductProduct(models.Model):
             self.update({"product_product_link_count": 0})
             return
 
-        domain = [
-            "|",
-            ("left_product_id", "in", self.ids),
-            ("right_product_id", "in", self.ids),
-        ]
-
-        res_1 = link_model.read_group(
-            domain=domain,
-            fields=["left_product_id"],
-            groupby=["left_product_id"],
-        )
-        res_2 = link_model.read_group(
-            domain=domain,
-            fields=["right_product_id"],
-            groupby=["right_product_id"],
+        link_dict = link_model._get_link_count(
+            "left_product_id", "right_product_id", self.ids
         )
-
-        link_dict = {}
-        for dic in res_1:
-            link_id = dic["left_product_id"][0]
-            link_dict.setdefault(link_id, 0)
-            link_dict[link_id] += dic["left_product_id_count"]
-        for dic in res_2:
-            link_id = dic["right_product_id"][0]
-            link_dict.setdefault(link_id, 0)
-            link_dict[link_id] += dic["right_product_id_count"]
-
         for rec in self:
             rec.product_product_link_count = link_dict.get(rec.id, 0)
 
@@ -2,6 +2,8 @@
 # Simone Orsi <simahawk@gmail.com>
 # License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl).
 
+from collections import Counter
+
 from odoo import _, api, exceptions, fields, models
 
 
@@ -39,32 +41,98 @@ class ProductTemplateLink(models.Model):
                     raise exceptions.ValidationError(
                         _("Source and target variants are required!")
                     )
+        else:
+            self._check_template_duplicates()
         super()._check_products()
 
+    def _check_template_duplicates(self):
+        """Only one link of each type between the same templates, whatever
+        their variants, when the check on variants is turned off.
+
+        :raise: ValidationError if not ok
+        """
+        templates = self._get_link_templates()
+        links = self.search(
+            [
+                ("left_product_tmpl_id", "in", templates.ids),
+                ("right_product_tmpl_id", "in", templates.ids),
+                ("type_id", "in", self.type_id.ids),
+            ]
+        )
+        key_counts = Counter(link._get_link_template_key() for link in links)
+        duplicates = self.filtered(
+            lambda link: key_counts[link._get_link_template_key()] > 1
+        )
+        if duplicates:
+            raise exceptions.ValidationError(
+                _(
+                    "Only one link with the same type is allowed between 2 "
+                    "products. \n %s"
+                )
+                % "\n ".join(link._duplicate_link_error_msg() for link in duplicates)
+            )
+
     def _check_product_not_different(self):
         res = super()._check_product_not_different()
         if self._product_variant_check_enabled():
             return res and self.left_product_id == self.right_product_id
         return res
 
-    def _check_products_query_params(self):
-        params = super()._check_products_query_params()
-        if self._product_variant_check_enabled():
-            params["main_select_columns"] += ", right_product_id, left_product_id"
-            params[
-                "l2_join_where_clause"
-            ] += """
-                AND right_product_id = l1.left_product_id
-                AND left_product_id = l1.right_product_id
-            """
-            params[
-                "l3_join_where_clause"
-            ] += """
-                AND left_product_id = l1.left_product_id
-                AND right_product_id = l1.right_product_id
-            """
-        return params
-
-    def _invalidate_links(self):
-        super()._invalidate_links()
-        self.env["product.product"].invalidate_cache(["product_variant_link_ids"])
+    def _get_link_template_unique_indexes(self):
+        """Unique indexes of the links without the variants, restored when
+        the module is uninstalled.
+        """
+        return super()._get_link_unique_indexes()
+
+    def _get_link_unique_indexes(self):
+        # The variants of the same templates can be linked several times, so
+        # the templates are only unique for the links without both variants
+        indexes = self._get_link_template_unique_indexes()
+        expressions, __ = indexes.pop("{}_unique_pair_index".format(self._table))
+        indexes.update(
+            {
+                "{}_unique_template_pair_index".format(self._table): (
+                    expressions,
+                    "left_product_id IS NULL OR right_product_id IS NULL",
+                ),
+                "{}_unique_variant_pair_index".format(self._table): (
+                    expressions
+                    + [
+                        "LEAST(left_product_id, right_product_id)",
+                        "GREATEST(left_product_id, right_product_id)",
+                    ],
+                    "left_product_id IS NOT NULL AND right_product_id IS NOT NULL",
+                ),
+            }
+        )
+        return indexes
+
+    def _get_link_unique_index_names(self):
+        return super()._get_link_unique_index_names() | {
+            "{}_unique_template_pair_index".format(self._table),
+            "{}_unique_variant_pair_index".format(self._table),
+        }
+
+    def _get_link_unique_fields(self):
+        return super()._get_link_unique_fields() + [
+            "left_product_id",
+            "right_product_id",
+        ]
+
+    def _get_link_template_key(self):
+        """Key of the link between the templates, whatever their variants."""
+        return super()._get_link_unique_key()
+
+    def _get_link_unique_key(self):
+        key = self._get_link_template_key()
+        if self.left_product_id and self.right_product_id:
+            left, right = self.left_product_id.id, self.right_product_id.id
+            key += (min(left, right), max(left, right))
+        return key
+
+    def _invalidate_links(self, templates):
+        super()._invalidate_links(templates)
+        variants = templates.with_context(active_test=False).product_variant_ids
+        self.env["product.product"].invalidate_cache(
+            ["product_variant_link_ids", "product_product_link_count"], variants.ids
+        )
@@ -4,6 +4,9 @@
 
 from odoo.exceptions import ValidationError
 from odoo.tests.common import SavepointCase
+from odoo.tools import index_exists, mute_logger
+
+from ..hooks import uninstall_hook
 
 
 class TestProductVariantLink(SavepointCase):
@@ -42,6 +45,7 @@ class TestProductVariantLink(SavepointCase):
             err.exception.args[0], "Source and target variants are required!"
         )
 
+    @mute_logger("odoo.sql_db")
     def test_duplicated_link_different_product(self):
         link1 = self._create_link_default()
         with self.assertRaises(ValidationError), self.env.cr.savepoint():
@@ -71,6 +75,33 @@ class TestProductVariantLink(SavepointCase):
                 }
             )
 
+    def test_duplicated_link_bypass_check(self):
+        ProductTemplateLink = self.ProductTemplateLink.with_context(
+            _product_variant_link_bypass_check=True
+        )
+        product_4 = self.env.ref("product.product_product_4")
+        product_4b = self.env.ref("product.product_product_4b")
+        vals = {
+            "left_product_tmpl_id": product_4.product_tmpl_id.id,
+            "left_product_id": product_4.id,
+            "right_product_tmpl_id": self.product_product_1.product_tmpl_id.id,
+            "right_product_id": self.product_product_1.id,
+            "type_id": self.link_type.id,
+        }
+        ProductTemplateLink.create(vals)
+        # Without the check on variants, the templates are only linked once
+        with self.assertRaises(ValidationError), self.env.cr.savepoint():
+            ProductTemplateLink.create(dict(vals, left_product_id=product_4b.id))
+        self.ProductTemplateLink.create(dict(vals, left_product_id=product_4b.id))
+
+    def test_uninstall_hook(self):
+        table = self.ProductTemplateLink._table
+        uninstall_hook(self.env.cr, self.env.registry)
+        self.assertTrue(index_exists(self.env.cr, "{}_unique_pair_index".format(table)))
+        self.assertFalse(
+            index_exists(self.env.cr, "{}_unique_variant_pair_index".format(table))
+        )
+
     def test_product_variant_link_ids(self):
         link1 = self._create_link_default()
         self.assertIn(link1, self.product_product_1.product_template_link_ids)
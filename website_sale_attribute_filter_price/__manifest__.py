@@ -4,10 +4,15 @@
     "name": "Website Sale Attribute Filter Price",
     "category": "Website",
     "summary": "A price filter for website sale",
-    "version": "14.0.1.0.0",
+    "version": "14.0.1.2.0",
     "license": "LGPL-3",
-    "depends": ["website_sale"],
-    "data": ["templates/assets.xml", "templates/shop.xml"],
+    "depends": ["website_sale_shop_facets"],
+    "data": [
+        "security/ir.model.access.csv",
+        "data/ir_cron.xml",
+        "templates/assets.xml",
+        "templates/shop.xml",
+    ],
     "author": "Tecnativa, Odoo Community Association (OCA)",
     "website": "https://github.com/OCA/e-commerce",
     "installable": True,
@@ -18,14 +18,25 @@ class WebsiteSale(WebsiteSale):
         if price_vals:
             to_add = []
             if price_vals[0] is not None:
-                to_add += [("list_price", ">=", price_vals[0])]
+                to_add += [("filter_price", ">=", price_vals[0])]
             if price_vals[1] is not None:
-                to_add += [("list_price", "<=", price_vals[1])]
+                to_add += [("filter_price", "<=", price_vals[1])]
             if len(to_add) == 2:
                 to_add.insert(0, "&")
             domain += to_add
         return domain
 
+    def _get_search_domain_cache_key(
+        self, search, category, attrib_values, search_in_description=True
+    ):
+        key = super()._get_search_domain_cache_key(
+            search, category, attrib_values, search_in_description
+        )
+        price_vals = request.env.context.get("price_vals") or [None, None]
+        if all(price is None for price in price_vals):
+            return key + (None,)
+        return key + (tuple(price_vals),)
+
     @http.route()
     def shop(self, page=0, category=None, search="", ppg=False, **post):
         # User values
@@ -58,18 +69,12 @@ class WebsiteSale(WebsiteSale):
             partner=request.env.user.partner_id,
             price_vals=None,
         )
-        product_id = (
-            request.env["product.template"]
-            .with_context(prefetch_fields=False)
-            .search(
-                self._get_search_domain(
-                    search, category, response.qcontext.get("attrib_values")
-                ),
-                order="list_price DESC",
-                limit=1,
-            )
+        # The facets of the search without price filter are shared with the
+        # other shop filters of the request
+        domain = self._get_cached_search_domain(
+            search, category, response.qcontext.get("attrib_values")
         )
-        max_price = product_id.list_price
+        max_price = self._get_cached_shop_facets(domain)["filter_price"]["max"]
         # Price Filter QWeb Values
         keep = QueryURL(
             "/shop",
@@ -0,0 +1,4 @@
+from . import product_pricelist_item
+from . import product_template
+from . import product_template_pricelist_price
+from . import res_partner
@@ -0,0 +1,23 @@
+# Copyright 2026 Tecnativa - Carlos Roca
+# License LGPL-3.0 or later (http://www.gnu.org/licenses/lgpl).
+from odoo import api, models
+
+
+class ProductPricelistItem(models.Model):
+    _inherit = "product.pricelist.item"
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        res = super().create(vals_list)
+        self.env["product.template.pricelist.price"]._trigger_refresh_prices()
+        return res
+
+    def write(self, vals):
+        res = super().write(vals)
+        self.env["product.template.pricelist.price"]._trigger_refresh_prices()
+        return res
+
+    def unlink(self):
+        res = super().unlink()
+        self.env["product.template.pricelist.price"]._trigger_refresh_prices()
+        return res
@@ -0,0 +1,101 @@
+# Copyright 2026 Tecnativa - Carlos Roca
+# License LGPL-3.0 or later (http://www.gnu.org/licenses/lgpl).
+from odoo import api, fields, models
+
+
+class ProductTemplate(models.Model):
+    _inherit = "product.template"
+
+    filter_price = fields.Float(
+        compute="_compute_filter_price",
+        search="_search_filter_price",
+        digits="Product Price",
+        help="Price in the current pricelist used by the website price filter.",
+    )
+
+    def _get_filter_pricelist(self):
+        pricelist_id = self.env.context.get("pricelist")
+        if pricelist_id:
+            return self.env["product.pricelist"].browse(pricelist_id)
+        return self.env["website"].get_current_website().get_current_pricelist()
+
+    @api.depends_context("pricelist", "website_id")
+    def _compute_filter_price(self):
+        pricelist = self._get_filter_pricelist()
+        prices = (
+            self.env["product.template.pricelist.price"]
+            .sudo()
+            .search_read(
+                [
+                    ("product_tmpl_id", "in", self.ids),
+                    ("pricelist_id", "=", pricelist.id),
+                ],
+                ["product_tmpl_id", "price"],
+            )
+        )
+        price_by_template = {
+            price["product_tmpl_id"][0]: price["price"] for price in prices
+        }
+        # Templates without stored price yet, until the cron stores them
+        missing = self.filtered(lambda template: template.id not in price_by_template)
+        if missing and pricelist:
+            price_by_template.update(
+                pricelist.get_products_price(
+                    missing, [1.0] * len(missing), [False] * len(missing)
+                )
+            )
+        for template in self:
+            template.filter_price = price_by_template.get(
+                template.id, template.list_price
+            )
+
+    def _search_filter_price(self, operator, value):
+        if operator not in (">", ">=", "<", "<=", "="):
+            return [("list_price", operator, value)]
+        pricelist = self._get_filter_pricelist()
+        query = """
+            SELECT product_tmpl_id
+            FROM product_template_pricelist_price
+            WHERE pricelist_id = %s AND price {} %s
+        """.format(
+            operator
+        )
+        return [("id", "inselect", (query, [pricelist.id or 0, value]))]
+
+    @api.model
+    def _get_shop_facets_queries(self):
+        return super()._get_shop_facets_queries() + [
+            """
+            SELECT
+                'filter_price',
+                NULL::integer,
+                count(*),
+                min(pp.price)::numeric,
+                max(pp.price)::numeric
+            FROM product_template_pricelist_price pp
+            JOIN shop_templates st ON st.id = pp.product_tmpl_id
+            WHERE pp.pricelist_id = {}
+            """.format(
+                self._get_filter_pricelist().id or 0
+            )
+        ]
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        res = super().create(vals_list)
+        self.env["product.template.pricelist.price"]._trigger_refresh_prices()
+        return res
+
+    def write(self, vals):
+        res = super().write(vals)
+        if set(vals) & {
+            "list_price",
+            "standard_price",
+            "categ_id",
+            "sale_ok",
+            "active",
+        }:
+            self.env["product.template.pricelist.price"].sudo()._refresh_prices(
+                templates=self
+            )
+        return res
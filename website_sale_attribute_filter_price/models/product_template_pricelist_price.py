@@ -0,0 +1,152 @@
+# Copyright 2026 Tecnativa - Carlos Roca
+# License LGPL-3.0 or later (http://www.gnu.org/licenses/lgpl).
+from psycopg2.extras import execute_values
+
+from odoo import api, fields, models, tools
+from odoo.tools import split_every
+
+
+class ProductTemplatePricelistPrice(models.Model):
+    _name = "product.template.pricelist.price"
+    _description = "Product price by pricelist for the website price filter"
+    _log_access = False
+
+    product_tmpl_id = fields.Many2one(
+        comodel_name="product.template",
+        required=True,
+        ondelete="cascade",
+        index=True,
+    )
+    pricelist_id = fields.Many2one(
+        comodel_name="product.pricelist",
+        required=True,
+        ondelete="cascade",
+    )
+    price = fields.Float(digits="Product Price")
+
+    _sql_constraints = [
+        (
+            "product_pricelist_uniq",
+            "unique(pricelist_id, product_tmpl_id)",
+            "Only one price by product and pricelist is allowed.",
+        )
+    ]
+
+    def init(self):
+        tools.create_index(
+            self._cr,
+            "product_template_pricelist_price_pricelist_price_index",
+            self._table,
+            ["pricelist_id", "price"],
+        )
+
+    @api.model
+    def _get_refresh_pricelists(self):
+        """Pricelists whose prices are stored: the ones offered on websites and
+        the ones set on partners, which apply to them on the website too.
+        """
+        pricelists = self.env["website"].search([]).mapped("pricelist_ids")
+        field = self.env["ir.model.fields"]._get(
+            "res.partner", "property_product_pricelist"
+        )
+        groups = (
+            self.env["ir.property"]
+            .sudo()
+            .read_group(
+                [("fields_id", "=", field.id), ("value_reference", "!=", False)],
+                ["value_reference"],
+                ["value_reference"],
+            )
+        )
+        partner_pricelist_ids = [
+            int(group["value_reference"].split(",")[1]) for group in groups
+        ]
+        return pricelists | self.env["product.pricelist"].search(
+            [("id", "in", partner_pricelist_ids)]
+        )
+
+    @api.model
+    def _get_refresh_templates_domain(self):
+        return [("sale_ok", "=", True)]
+
+    @api.model
+    def _refresh_prices(self, templates=None, pricelists=None):
+        """Store the price of the templates for one unit in each pricelist.
+
+        Prices are computed by pricelist in batches and saved with an upsert,
+        so the website price filter and its bounds can be read from the
+        table instead of computing the pricelist rules for every product.
+        Only the changed prices are written, and the prices of the templates
+        that can't be sold anymore are deleted.
+        """
+        self.flush()
+        self.env["product.template"].flush()
+        domain = self._get_refresh_templates_domain()
+        if pricelists is None:
+            pricelists = self._get_refresh_pricelists()
+        if templates is None:
+            templates = self.env["product.template"].search(domain)
+            query = self.env["product.template"]._where_calc(domain)
+            from_clause, where_clause, where_params = query.get_sql()
+            self.env.cr.execute(
+                """
+                DELETE FROM product_template_pricelist_price
+                WHERE pricelist_id NOT IN %s OR product_tmpl_id NOT IN (
+                    SELECT "product_template".id FROM {} WHERE {}
+                )
+                """.format(
+                    from_clause, where_clause or "TRUE"
+                ),
+                [tuple(pricelists.ids) or (0,)] + where_params,
+            )
+        else:
+            unsold_templates = templates - self.env["product.template"].search(
+                domain + [("id", "in", templates.ids)]
+            )
+            if unsold_templates:
+                self.env.cr.execute(
+                    """
+                    DELETE FROM product_template_pricelist_price
+                    WHERE product_tmpl_id IN %s
+                    """,
+                    (tuple(unsold_templates.ids),),
+                )
+            templates -= unsold_templates
+        for pricelist in pricelists:
+            for template_ids in split_every(1000, templates.ids):
+                batch = templates.browse(template_ids)
+                prices = pricelist.get_products_price(
+                    batch, [1.0] * len(batch), [False] * len(batch)
+                )
+                if not prices:
+                    continue
+                execute_values(
+                    self.env.cr._obj,
+                    """
+                    INSERT INTO product_template_pricelist_price
+                        (product_tmpl_id, pricelist_id, price)
+                    VALUES %s
+                    ON CONFLICT (pricelist_id, product_tmpl_id)
+                    DO UPDATE SET price = EXCLUDED.price
+                    WHERE product_template_pricelist_price.price
+                        IS DISTINCT FROM EXCLUDED.price
+                    """,
+                    [
+                        (template_id, pricelist.id, price)
+                        for template_id, price in prices.items()
+                    ],
+                )
+        self.invalidate_cache()
+
+    @api.model
+    def _trigger_refresh_prices(self):
+        """Refresh the stored prices as soon as possible with the cron, for the
+        changes that can affect many products or that happen in batches.
+        """
+        self.env.ref(
+            "website_sale_attribute_filter_price.ir_cron_refresh_filter_prices"
+        ).sudo()._trigger()
+
+    @api.model
+    def _cron_refresh_prices(self):
+        self._refresh_prices()
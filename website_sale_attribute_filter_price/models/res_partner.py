@@ -0,0 +1,20 @@
+# Copyright 2026 Tecnativa - Carlos Roca
+# License LGPL-3.0 or later (http://www.gnu.org/licenses/lgpl).
+from odoo import api, models
+
+
+class ResPartner(models.Model):
+    _inherit = "res.partner"
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        res = super().create(vals_list)
+        if any("property_product_pricelist" in vals for vals in vals_list):
+            self.env["product.template.pricelist.price"]._trigger_refresh_prices()
+        return res
+
+    def write(self, vals):
+        res = super().write(vals)
+        if "property_product_pricelist" in vals:
+            self.env["product.template.pricelist.price"]._trigger_refresh_prices()
+        return res
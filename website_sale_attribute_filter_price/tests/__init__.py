@@ -0,0 +1,2 @@
+from . import test_filter_price
+from . import test_shop_queries
@@ -0,0 +1,150 @@
+# Copyright 2026 Tecnativa - Carlos Roca
+# License LGPL-3.0 or later (http://www.gnu.org/licenses/lgpl).
+from odoo.tests.common import SavepointCase
+
+
+class TestFilterPrice(SavepointCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.PricelistPrice = cls.env["product.template.pricelist.price"]
+        cls.cron = cls.env.ref(
+            "website_sale_attribute_filter_price.ir_cron_refresh_filter_prices"
+        )
+        cls.pricelist = cls.env["product.pricelist"].create(
+            {
+                "name": "Test filter price",
+                "currency_id": cls.env.company.currency_id.id,
+            }
+        )
+        # Only used by a partner, not offered on any website
+        cls.env["res.partner"].create(
+            {
+                "name": "Test filter price customer",
+                "property_product_pricelist": cls.pricelist.id,
+            }
+        )
+        cls.template_stored, cls.template_fallback = cls.env["product.template"].create(
+            [
+                {"name": "Test filter price stored", "list_price": 100.0},
+                {"name": "Test filter price fallback", "list_price": 80.0},
+            ]
+        )
+        cls.templates = cls.template_stored + cls.template_fallback
+        cls.item = cls.env["product.pricelist.item"].create(
+            {
+                "pricelist_id": cls.pricelist.id,
+                "applied_on": "1_product",
+                "product_tmpl_id": cls.template_stored.id,
+                "compute_price": "fixed",
+                "fixed_price": 50.0,
+            }
+        )
+        cls.PricelistPrice._refresh_prices(
+            templates=cls.templates, pricelists=cls.pricelist
+        )
+
+    def _get_stored_price(self, template):
+        return self.PricelistPrice.search(
+            [
+                ("product_tmpl_id", "=", template.id),
+                ("pricelist_id", "=", self.pricelist.id),
+            ]
+        ).price
+
+    def _get_cron_triggers(self):
+        return self.env["ir.cron.trigger"].search([("cron_id", "=", self.cron.id)])
+
+    def test_refresh_pricelists(self):
+        self.assertIn(self.pricelist, self.PricelistPrice._get_refresh_pricelists())
+
+    def test_refresh_item_change(self):
+        self.assertEqual(self._get_stored_price(self.template_stored), 50.0)
+        triggers = self._get_cron_triggers()
+        self.item.fixed_price = 40.0
+        self.assertTrue(self._get_cron_triggers() - triggers)
+        self.PricelistPrice._cron_refresh_prices()
+        self.assertEqual(self._get_stored_price(self.template_stored), 40.0)
+
+    def test_refresh_template_change(self):
+        triggers = self._get_cron_triggers()
+        template = self.env["product.template"].create(
+            {"name": "Test filter price new", "list_price": 60.0}
+        )
+        # New templates are left to the cron
+        self.assertTrue(self._get_cron_triggers() - triggers)
+        self.assertFalse(self._get_stored_price(template))
+        template.list_price = 70.0
+        self.assertEqual(self._get_stored_price(template), 70.0)
+
+    def test_search_filter_price(self):
+        templates = self.templates.with_context(pricelist=self.pricelist.id)
+        self.assertEqual(templates[0].filter_price, 50.0)
+        self.assertEqual(templates[1].filter_price, 80.0)
+        # The pricelist price is used instead of the public price
+        self.assertEqual(
+            templates.search(
+                [("id", "in", self.templates.ids), ("filter_price", "<=", 60.0)]
+            ),
+            self.template_stored,
+        )
+        self.assertEqual(
+            templates.search(
+                [("id", "in", self.templates.ids), ("filter_price", ">=", 70.0)]
+            ),
+            self.template_fallback,
+        )
+
+    def test_filter_price_pricelist_context(self):
+        other_pricelist = self.env["product.pricelist"].create(
+            {"name": "Test filter price other"}
+        )
+        template = self.template_stored.with_context(pricelist=self.pricelist.id)
+        self.assertEqual(template.filter_price, 50.0)
+        # Not stored for this pricelist, computed until the cron stores it
+        self.assertEqual(
+            template.with_context(pricelist=other_pricelist.id).filter_price, 100.0
+        )
+
+    def test_refresh_unsold_templates(self):
+        self.template_fallback.sale_ok = False
+        self.assertFalse(self._get_stored_price(self.template_fallback))
+        self.template_stored.active = False
+        self.assertFalse(self._get_stored_price(self.template_stored))
+        self.template_stored.active = True
+        self.assertEqual(self._get_stored_price(self.template_stored), 50.0)
+        self.env.cr.execute(
+            "UPDATE product_template SET sale_ok = FALSE WHERE id = %s",
+            (self.template_stored.id,),
+        )
+        self.template_stored.invalidate_cache(["sale_ok"])
+        self.PricelistPrice._cron_refresh_prices()
+        self.assertFalse(self._get_stored_price(self.template_stored))
+
+    def _get_stored_rows(self):
+        self.env.cr.execute(
+            """
+            SELECT ctid::text FROM product_template_pricelist_price
+            WHERE product_tmpl_id IN %s
+            """,
+            (tuple(self.templates.ids),),
+        )
+        return sorted(row[0] for row in self.env.cr.fetchall())
+
+    def test_refresh_unchanged_prices(self):
+        rows = self._get_stored_rows()
+        self.PricelistPrice._refresh_prices(
+            templates=self.templates, pricelists=self.pricelist
+        )
+        # The rows with the same price are not updated again
+        self.assertEqual(self._get_stored_rows(), rows)
+
+    def test_facets(self):
+        facets = (
+            self.env["product.template"]
+            .with_context(pricelist=self.pricelist.id)
+            ._get_shop_facets([("id", "in", self.templates.ids)])
+        )
+        self.assertEqual(facets["filter_price"]["count"], 2)
+        self.assertEqual(facets["filter_price"]["min"], 50.0)
+        self.assertEqual(facets["filter_price"]["max"], 80.0)
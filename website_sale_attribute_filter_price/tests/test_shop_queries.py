@@ -0,0 +1,45 @@
+# Copyright 2026 Tecnativa - Carlos Roca
+# License LGPL-3.0 or later (http://www.gnu.org/licenses/lgpl).
+from unittest.mock import patch
+
+from odoo.tests import HttpCase, tagged
+
+from odoo.addons.website_sale.controllers.main import WebsiteSale
+
+
+@tagged("post_install", "-at_install")
+class TestShopQueries(HttpCase):
+    def setUp(self):
+        super().setUp()
+        self.env["product.template"].create(
+            {"name": "Test shop queries", "is_published": True, "list_price": 10.0}
+        )
+        self.env["product.template.pricelist.price"]._refresh_prices()
+
+    def _count_shop_queries(self, url):
+        ProductTemplate = type(self.env["product.template"])
+        with patch.object(
+            ProductTemplate,
+            "_get_shop_facets",
+            autospec=True,
+            side_effect=ProductTemplate._get_shop_facets,
+        ) as mock_facets, patch.object(
+            WebsiteSale,
+            "_get_search_domain",
+            autospec=True,
+            side_effect=WebsiteSale._get_search_domain,
+        ) as mock_domain:
+            self.assertEqual(self.url_open(url).status_code, 200)
+        return mock_domain.call_count, mock_facets.call_count
+
+    def test_shop_queries(self):
+        # The listing domain is computed by website_sale, the shop filters
+        # share one computation of the same domain and its facets
+        self.assertEqual(self._count_shop_queries("/shop?search=Test shop"), (2, 1))
+
+    def test_shop_queries_price_filter(self):
+        # The slider bounds need the domain and facets without price filter
+        self.assertEqual(
+            self._count_shop_queries("/shop?search=Test shop&min_price=1&max_price=20"),
+            (3, 2),
+        )
@@ -5,12 +5,16 @@
 {
     "name": "Website Sale Cart Expire",
     "summary": "Expire abandoned carts",
-    "version": "14.0.1.0.1",
+    "version": "14.0.1.3.0",
     "author": "Camptocamp, Odoo Community Association (OCA)",
     "maintainers": ["ivantodorovich"],
     "website": "https://github.com/OCA/e-commerce",
     "license": "AGPL-3",
     "category": "Website",
     "depends": ["website_sale"],
-    "data": ["data/ir_cron.xml", "views/res_config_settings.xml"],
+    "data": [
+        "data/ir_cron.xml",
+        "views/res_config_settings.xml",
+        "views/sale_order_views.xml",
+    ],
 }
@@ -0,0 +1,21 @@
+# License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl).
+
+
+def migrate(cr, version):
+    """Create and fill the stored cart expire date in SQL, instead of letting
+    the ORM compute it for every existing order.
+    """
+    cr.execute(
+        "ALTER TABLE sale_order ADD COLUMN IF NOT EXISTS cart_expire_date timestamp"
+    )
+    cr.execute(
+        """
+        UPDATE sale_order so
+        SET cart_expire_date = COALESCE(so.write_date, now() at time zone 'UTC')
+            + w.cart_expire_delay * interval '1 hour'
+        FROM website w
+        WHERE w.id = so.website_id
+            AND w.cart_expire_delay > 0
+            AND so.state IN ('draft', 'sent')
+        """
+    )
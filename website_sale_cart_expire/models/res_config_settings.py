@@ -11,3 +11,6 @@ class ResConfigSettings(models.TransientModel):
     cart_expire_delay = fields.Float(
         related="website_id.cart_expire_delay", readonly=False
     )
+    cart_purge_delay = fields.Integer(
+        related="website_id.cart_purge_delay", readonly=False
+    )
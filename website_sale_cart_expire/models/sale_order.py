@@ -4,7 +4,7 @@
 
 from datetime import timedelta
 
-from odoo import api, fields, models
+from odoo import _, api, fields, models, tools
 
 
 class SaleOrder(models.Model):
@@ -12,11 +12,27 @@ class SaleOrder(models.Model):
 
     cart_expire_date = fields.Datetime(
         compute="_compute_cart_expire_date",
+        store=True,
         help="Technical field: The date this cart will automatically expire",
     )
 
-    @api.depends("write_date", "website_id.cart_expire_delay")
+    def init(self):
+        # Only the carts that can expire have a date
+        index_name = "sale_order_cart_expire_date_index"
+        if not tools.index_exists(self._cr, index_name):
+            self._cr.execute(
+                """
+                CREATE INDEX {} ON {} (cart_expire_date)
+                WHERE cart_expire_date IS NOT NULL
+                """.format(
+                    index_name, self._table
+                )
+            )
+
+    @api.depends("state", "write_date", "website_id")
     def _compute_cart_expire_date(self):
+        # The change of the website delay recomputes its carts only, see
+        # website.write
         for rec in self:
             if rec.state in ["draft", "sent"] and rec.website_id.cart_expire_delay > 0:
                 # In case of draft records, use current date
@@ -25,3 +41,43 @@ class SaleOrder(models.Model):
                 rec.cart_expire_date = from_date + expire_delta
             elif rec.cart_expire_date:
                 rec.cart_expire_date = False
+
+    def _update_cart_expire_date(self):
+        """Postpone the expire date of the carts on the changes of their lines,
+        as they update the orders in SQL only, when their amounts are saved.
+        """
+        now = fields.Datetime.now()
+        carts = self.filtered(
+            lambda order: order.state in ["draft", "sent"]
+            and order.website_id.cart_expire_delay > 0
+        )
+        for website in carts.website_id:
+            carts.filtered(lambda order: order.website_id == website).write(
+                {"cart_expire_date": now + timedelta(hours=website.cart_expire_delay)}
+            )
+
+    def _expire_carts(self):
+        """Cancel the carts, logging it in their chatter in one batch."""
+        self._message_log_batch(bodies={cart.id: _("Cart expired") for cart in self})
+        self._action_cancel()
+
+
+class SaleOrderLine(models.Model):
+    _inherit = "sale.order.line"
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        lines = super().create(vals_list)
+        lines.order_id._update_cart_expire_date()
+        return lines
+
+    def write(self, vals):
+        res = super().write(vals)
+        self.order_id._update_cart_expire_date()
+        return res
+
+    def unlink(self):
+        orders = self.order_id
+        res = super().unlink()
+        orders._update_cart_expire_date()
+        return res
@@ -2,9 +2,11 @@
 # @author Iván Todorovich <ivan.todorovich@gmail.com>
 # License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl).
 
+import threading
+import time
 from datetime import timedelta
 
-from odoo import _, api, fields, models
+from odoo import api, fields, models
 from odoo.osv import expression
 
 
@@ -17,29 +19,111 @@ class Website(models.Model):
         help="Automatically cancel website orders after the given time.\n"
         "Set to 0 to disable this feature.",
     )
+    cart_purge_delay = fields.Integer(
+        string="Purge Delay",
+        default=0,
+        help="Automatically delete the cancelled carts of the public user "
+        "after the given days.\nSet to 0 to disable this feature.",
+    )
+
+    def write(self, vals):
+        res = super().write(vals)
+        if "cart_expire_delay" in vals:
+            carts = self.env["sale.order"].sudo().search(
+                [("website_id", "in", self.ids), ("state", "in", ["draft", "sent"])]
+            )
+            self.env.add_to_compute(
+                self.env["sale.order"]._fields["cart_expire_date"], carts
+            )
+        return res
 
     def _get_cart_expire_delay_domain(self):
         self.ensure_one()
-        expire_date = fields.Datetime.now() - timedelta(hours=self.cart_expire_delay)
         return [
             ("website_id", "=", self.id),
             ("state", "in", ["draft", "sent"]),
-            ("write_date", "<=", expire_date),
+            ("cart_expire_date", "<=", fields.Datetime.now()),
+        ]
+
+    def _get_cart_purge_delay_domain(self):
+        self.ensure_one()
+        purge_date = fields.Datetime.now() - timedelta(days=self.cart_purge_delay)
+        return [
+            ("website_id", "=", self.id),
+            ("state", "=", "cancel"),
+            ("partner_id", "=", self.user_id.partner_id.id),
+            ("write_date", "<=", purge_date),
         ]
 
     @api.model
-    def _scheduler_website_expire_cart(self):
+    def _iter_cart_batches(self, domain, batch_size, time_limit, cron_xmlid):
+        """Iterate over the carts of the domain in batches of ``batch_size``,
+        committing after each of them.
+
+        When the iteration takes more than ``time_limit`` seconds, it stops and
+        the cron is triggered again for processing the remaining carts.
+        """
+        auto_commit = not getattr(threading.current_thread(), "testing", False)
+        start = time.monotonic()
+        last_id = 0
+        while True:
+            carts = self.env["sale.order"].sudo().search(
+                expression.AND([domain, [("id", ">", last_id)]]),
+                limit=batch_size,
+                order="id",
+            )
+            if not carts:
+                return
+            yield carts
+            if auto_commit:
+                self.env.cr.commit()
+            if len(carts) < batch_size:
+                return
+            last_id = carts[-1].id
+            if time.monotonic() - start > time_limit:
+                self.env.ref(cron_xmlid)._trigger()
+                return
+
+    @api.model
+    def _scheduler_website_expire_cart(self, batch_size=500, time_limit=60):
+        """Expire the abandoned carts of all the websites.
+
+        The carts are expired in batches of ``batch_size``, committing after
+        each of them. When the run takes more than ``time_limit`` seconds, the
+        cron is triggered again for expiring the remaining carts.
+        """
         websites = self.search([("cart_expire_delay", ">", 0)])
         if not websites:
             return True
         # Get all carts to expire
-        carts_to_expire_domains = [
-            website._get_cart_expire_delay_domain() for website in websites
-        ]
-        carts_to_expire = self.env["sale.order"].search(
-            expression.OR(carts_to_expire_domains)
+        carts_to_expire_domain = expression.OR(
+            [website._get_cart_expire_delay_domain() for website in websites]
+        )
+        for carts_to_expire in self._iter_cart_batches(
+            carts_to_expire_domain,
+            batch_size,
+            time_limit,
+            "website_sale_cart_expire.ir_cron_cart_expire",
+        ):
+            carts_to_expire._expire_carts()
+        return True
+
+    @api.model
+    def _scheduler_website_purge_cart(self, batch_size=500, time_limit=60):
+        """Delete the cancelled carts of the public user of all the websites,
+        in batches like ``_scheduler_website_expire_cart``.
+        """
+        websites = self.search([("cart_purge_delay", ">", 0)])
+        if not websites:
+            return True
+        carts_to_purge_domain = expression.OR(
+            [website._get_cart_purge_delay_domain() for website in websites]
         )
-        # Expire carts
-        for cart in carts_to_expire:
-            cart.message_post(body=_("Cart expired"))
-        carts_to_expire._action_cancel()
+        for carts_to_purge in self._iter_cart_batches(
+            carts_to_purge_domain,
+            batch_size,
+            time_limit,
+            "website_sale_cart_expire.ir_cron_cart_purge",
+        ):
+            carts_to_purge.unlink()
+        return True
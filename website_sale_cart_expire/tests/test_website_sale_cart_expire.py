@@ -31,10 +31,49 @@ class TestWebsiteSaleCartExpire(common.SavepointCase):
     def test_expire_dates(self):
         # Expire Date is set in the future
         self.assertTrue(self.order_1.cart_expire_date)
+        # It's stored, so the carts can be searched by it
+        self.assertIn(
+            self.order_1,
+            self.env["sale.order"].search(
+                [("cart_expire_date", "=", self.order_1.cart_expire_date)]
+            ),
+        )
         # Changing to a website without expire delay should remove it
         self.order_1.website_id = self.website_1
         self.assertFalse(self.order_1.cart_expire_date)
 
+    def test_expire_date_cart_activity(self):
+        # Adding a line to a cart postpones its expiration
+        later = datetime.now().replace(microsecond=0) + timedelta(hours=2)
+        with mock.patch("odoo.fields.Datetime.now") as mock_now:
+            mock_now.return_value = later
+            self.env["sale.order.line"].create(
+                {
+                    "order_id": self.order_1.id,
+                    "name": "Test",
+                    "product_id": self.order_1.order_line[0].product_id.id,
+                    "product_uom_qty": 1,
+                }
+            )
+        self.assertEqual(self.order_1.cart_expire_date, later + timedelta(hours=2))
+        with mock.patch("odoo.fields.Datetime.now") as mock_now:
+            mock_now.return_value = datetime.now() + timedelta(hours=3)
+            self.env["website"]._scheduler_website_expire_cart()
+        self.assertEqual(self.order_1.state, "draft")
+        self.assertEqual(self.order_2.state, "cancel")
+
+    def test_expire_date_delay(self):
+        # Changing the delay only recomputes the carts of the website
+        self.order_2.action_confirm()
+        self.website_2.cart_expire_delay = 4.00
+        self.assertEqual(
+            self.order_1.cart_expire_date,
+            self.order_1.write_date + timedelta(hours=4),
+        )
+        self.assertFalse(self.order_2.cart_expire_date)
+        self.website_2.cart_expire_delay = 0.00
+        self.assertFalse(self.order_1.cart_expire_date)
+
     def test_expire_scheduler(self):
         # Case 1: We haven't reached the expire date yet
         self.env["website"]._scheduler_website_expire_cart()
@@ -57,3 +96,39 @@ class TestWebsiteSaleCartExpire(common.SavepointCase):
         self.assertEqual(self.order_2.state, "draft", "No expire delay on website 1")
         self.assertEqual(self.order_3.state, "cancel", "Should've been cancelled")
         self.assertEqual(self.order_4.state, "cancel", "Should've been cancelled")
+
+    def test_expire_scheduler_batches(self):
+        with mock.patch("odoo.fields.Datetime.now") as mock_now:
+            mock_now.return_value = datetime.now() + timedelta(hours=3)
+            self.env["website"]._scheduler_website_expire_cart(batch_size=3)
+        for order in self.orders:
+            self.assertEqual(order.state, "cancel")
+            self.assertIn("Cart expired", order.message_ids[0].body)
+
+    def test_expire_scheduler_time_limit(self):
+        cron = self.env.ref("website_sale_cart_expire.ir_cron_cart_expire")
+        with mock.patch("odoo.fields.Datetime.now") as mock_now, mock.patch.object(
+            type(cron), "_trigger"
+        ) as mock_trigger:
+            mock_now.return_value = datetime.now() + timedelta(hours=3)
+            self.env["website"]._scheduler_website_expire_cart(
+                batch_size=1, time_limit=-1
+            )
+        # Only the first batch is expired and the cron is triggered again
+        self.assertEqual(self.orders.mapped("state").count("cancel"), 1)
+        mock_trigger.assert_called_once()
+
+    def test_purge_scheduler(self):
+        self.website_2.cart_purge_delay = 1  # days
+        self.order_3.partner_id = self.website_2.user_id.partner_id
+        (self.order_3 + self.order_4).action_cancel()
+        # Case 1: We haven't reached the purge date yet
+        self.env["website"]._scheduler_website_purge_cart()
+        self.assertTrue(self.order_3.exists())
+        # Case 2: Only the cancelled carts of the public user are deleted
+        with mock.patch("odoo.fields.Datetime.now") as mock_now:
+            mock_now.return_value = datetime.now() + timedelta(days=2)
+            self.env["website"]._scheduler_website_purge_cart()
+        self.assertFalse(self.order_3.exists())
+        self.assertTrue(self.order_4.exists())
+        self.assertTrue(self.order_1.exists())
@@ -1,10 +1,10 @@
 {
     "name": "Website Sale Filter Product Brand",
     "author": "Advitus MB, Ooops, Cetmix, Odoo Community Association (OCA)",
-    "version": "14.0.1.0.0",
+    "version": "14.0.1.1.0",
     "website": "https://github.com/OCA/e-commerce",
     "category": "Website/Website",
-    "depends": ["product_brand", "website_sale"],
+    "depends": ["product_brand", "website_sale_shop_facets"],
     "demo": [
         "demo/product_brand_demo.xml",
         "demo/product_product_demo.xml",
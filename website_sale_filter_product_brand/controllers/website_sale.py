@@ -61,10 +61,26 @@ class Website(WebsiteSale):
         )
         return domain
 
-    def _remove_extra_brands(self, brands, search_products, attrib_values):
+    def _build_brands_list_from_facets(
+        self,
+        selected_brand_ids,
+        facets,
+        search=None,
+        products=None,
+        category=None,
+        attrib_values=None,
+    ):
+        """Build the brands list of the shop from the brands of the shop facets
+        instead of searching the products.
+        """
+        facet_brand_ids = list(facets.get("brand", {}))
+        if products and (search or category or attrib_values):
+            # The brands of the facets have products for sure
+            brands = request.env["product.brand"].browse(facet_brand_ids)
+        else:
+            brands = self._build_brands_list(selected_brand_ids, products=products)
         if attrib_values:
-            search_product_brands = search_products.mapped("product_brand_id")
-            brands = brands.filtered(lambda b: b.id in search_product_brands.ids)
+            brands = brands.filtered(lambda b: b.id in facet_brand_ids)
         # sort brands by name
         return brands.sorted(key=lambda brand: brand.name)
 
@@ -78,17 +94,20 @@ class Website(WebsiteSale):
         attrib_values = res.qcontext["attrib_values"]
         # get filtered products
         products = res.qcontext["products"]
-        domain = self._get_search_domain_no_brands(
-            search, category, attrib_values, search_in_description=False
-        )
-        search_products = request.env["product.template"].search(domain)
-        # build brands list
         brands_list = self._get_brand_ids(request.httprequest.args)
         selected_brand_ids = [int(brand) for brand in brands_list]
-        brands = self._build_brands_list(
-            selected_brand_ids, search, products, search_products, category
+        # Reuse the shop facets, unless they are restricted to the selected
+        # brands, so the other brands can still be chosen.
+        facets = res.qcontext["shop_facets"]
+        if brands_list:
+            domain = self._get_search_domain_no_brands(
+                search, category, attrib_values, search_in_description=False
+            )
+            facets = self._get_cached_shop_facets(domain)
+        # build brands list
+        brands = self._build_brands_list_from_facets(
+            selected_brand_ids, facets, search, products, category, attrib_values
         )
-        brands = self._remove_extra_brands(brands, search_products, attrib_values)
 
         # keep selected brands in URL
         keep = QueryURL(
@@ -105,9 +124,7 @@ class Website(WebsiteSale):
             {
                 "brands": brands,
                 "selected_brand_ids": selected_brand_ids,
-                "attr_valid": search_products.mapped(
-                    "attribute_line_ids.value_ids"
-                ).ids,
+                "attr_valid": list(facets.get("attribute_value", {})),
                 "keep": keep,
             }
         )
@@ -0,0 +1,22 @@
+from odoo import api, models
+
+
+class ProductTemplate(models.Model):
+    _inherit = "product.template"
+
+    @api.model
+    def _get_shop_facets_queries(self):
+        return super()._get_shop_facets_queries() + [
+            """
+            SELECT
+                'brand',
+                pt.product_brand_id,
+                count(*),
+                NULL::numeric,
+                NULL::numeric
+            FROM product_template pt
+            JOIN shop_templates st ON st.id = pt.id
+            WHERE pt.product_brand_id IS NOT NULL
+            GROUP BY pt.product_brand_id
+            """
+        ]
@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 from odoo.tests.common import HttpCase, SavepointCase
 
 from odoo.addons.website.tools import MockRequest
@@ -26,6 +28,21 @@ class TestWebsiteSaleFilterBrandHttpCase(HttpCase):
         """Test frontend tour."""
         self.start_tour("/shop", "website_sale_filter_product_brand", login="portal")
 
+    def test_shop_facets_queries(self):
+        """The brands and attributes filters reuse the facets of the shop,
+        unless brands are selected."""
+        brand = self.env["product.brand"].create({"name": "Test facets brand"})
+        ProductTemplate = type(self.env["product.template"])
+        for url, count in (("/shop", 1), ("/shop?brand=%s" % brand.id, 2)):
+            with patch.object(
+                ProductTemplate,
+                "_get_shop_facets",
+                autospec=True,
+                side_effect=ProductTemplate._get_shop_facets,
+            ) as mock_facets:
+                self.assertEqual(self.url_open(url).status_code, 200)
+            self.assertEqual(mock_facets.call_count, count, url)
+
 
 class WebsiteSale(SavepointCase):
     @classmethod
@@ -59,10 +76,17 @@ class WebsiteSale(SavepointCase):
             res1 = self.WebsiteSaleController._update_domain(brands_list, domain)
             res2 = self.WebsiteSaleController._update_domain(brands_list, simple_domain)
             res3 = self.WebsiteSaleController._build_brands_list(brands_list)
-            res4 = self.WebsiteSaleController._remove_extra_brands(
-                brand_ids, products, True
+            facets = self.env["product.template"]._get_shop_facets(
+                [("sale_ok", "=", True)]
+            )
+            res4 = self.WebsiteSaleController._build_brands_list_from_facets(
+                brands_list, facets, products=products, attrib_values=True
             )
         self.assertEqual(res1, required_domain, "Must be the same")
         self.assertEqual(res2, required_domain2, "Must be the same")
         self.assertEqual(res3.ids, brand_ids.ids, "Must be the same")
-        self.assertEqual(res4.ids, brand_ids.ids, "Must be the same")
+        self.assertEqual(
+            res4.ids,
+            products.mapped("product_brand_id").sorted(lambda b: b.name).ids,
+            "Must be the same",
+        )
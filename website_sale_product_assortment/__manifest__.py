@@ -3,7 +3,7 @@
 {
     "name": "eCommerce product assortment",
     "summary": "Use product assortments to display products available on e-commerce.",
-    "version": "14.0.1.0.0",
+    "version": "14.0.1.3.0",
     "development_status": "Beta",
     "license": "AGPL-3",
     "category": "Website",
@@ -11,6 +11,10 @@
     "author": "Tecnativa, Odoo Community Association (OCA)",
     "maintainers": ["CarlosRoca13"],
     "installable": True,
-    "depends": ["product_assortment", "website_sale"],
-    "data": ["templates/assets.xml", "views/ir_filters_views.xml"],
+    "depends": ["product_assortment", "website_sale_product_grid_info"],
+    "data": [
+        "data/ir_cron.xml",
+        "templates/assets.xml",
+        "views/ir_filters_views.xml",
+    ],
 }
@@ -9,46 +9,44 @@ from odoo.addons.website_sale.controllers.main import WebsiteSale
 
 
 class WebsiteSale(WebsiteSale):
+    def _get_assortment_restriction_domain(self):
+        """Domain of the product templates that have some variant allowed to be
+        shown by the assortments of the current partner, or None when there is
+        no restriction. It joins the materialized assortment members instead of
+        listing all the allowed variants.
+        """
+        assortments = request.env["ir.filters"]._get_partner_assortments(
+            request.env.user.partner_id, request.website, ["no_show"]
+        )
+        if not assortments:
+            return None
+        return [("product_variant_ids.assortment_member_ids", "in", assortments.ids)]
+
     def _get_products_allowed(self):
-        partner = request.env.user.partner_id
-        website_id = request.website.id
-        assortments = (
-            request.env["ir.filters"]
-            .sudo()
-            .search(
-                [
-                    ("is_assortment", "=", True),
-                    ("website_availability", "=", "no_show"),
-                    "|",
-                    ("website_ids", "=", False),
-                    ("website_ids", "=", website_id),
-                ]
-            )
+        """Get the variants allowed by the assortments of the current partner
+        and whether some assortment restricts them, from the materialized
+        members. The shop and the product page use the restriction domain
+        instead, see ``_get_assortment_restriction_domain``.
+        """
+        assortments = request.env["ir.filters"]._get_partner_assortments(
+            request.env.user.partner_id, request.website, ["no_show"]
         )
-        assortment_restriction = False
-        allowed_product_ids = set()
-        for assortment in assortments:
-            if (
-                # Set active_test to False to allow filtering by partners
-                # that are not active, (for example Public User)
-                partner
-                & assortment.with_context(active_test=False).all_partner_ids
-            ):
-                assortment_restriction = True
-                allowed_product_ids = allowed_product_ids.union(
-                    set(assortment.all_product_ids.ids)
-                )
-        return allowed_product_ids, assortment_restriction
+        return set(assortments.member_product_ids.ids), bool(assortments)
 
     @route()
     def product(self, product, category="", search="", **kwargs):
         """Overriding product method to avoid accessing to product sheet when the
         product assortments prevent to show them.
         """
-        allowed_product_ids, assortment_restriction = self._get_products_allowed()
-        if assortment_restriction:
-            if len(set(product.product_variant_ids.ids) & allowed_product_ids) == 0:
-                raise NotFound()
+        restriction_domain = self._get_assortment_restriction_domain()
+        if restriction_domain is not None and not (
+            request.env["product.template"]
+            .sudo()
+            .search_count(
+                expression.AND([[("id", "=", product.id)], restriction_domain])
+            )
+        ):
+            raise NotFound()
         return super().product(product, category=category, search=search, **kwargs)
 
     def _get_search_domain(
@@ -60,9 +58,7 @@ class WebsiteSale(WebsiteSale):
         res = super()._get_search_domain(
             search, category, attrib_values, search_in_description=search_in_description
         )
-        allowed_product_ids, assortment_restriction = self._get_products_allowed()
-        if assortment_restriction:
-            return expression.AND(
-                [res, [("product_variant_ids", "in", list(allowed_product_ids))]]
-            )
+        restriction_domain = self._get_assortment_restriction_domain()
+        if restriction_domain is not None:
+            return expression.AND([res, restriction_domain])
         return res
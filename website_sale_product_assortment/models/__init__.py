@@ -1,2 +1,4 @@
 from . import ir_filters
+from . import product_product
 from . import product_template
+from . import res_partner
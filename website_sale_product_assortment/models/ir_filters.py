@@ -1,6 +1,8 @@
 # Copyright 2021 Tecnativa - Carlos Roca
 # License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl).
-from odoo import api, fields, models
+from odoo import api, fields, models, tools
+from odoo.osv import expression
+from odoo.tools.safe_eval import safe_eval
 
 
 class IrFilters(models.Model):
@@ -40,6 +42,26 @@ class IrFilters(models.Model):
         relation="assortment_all_products",
         compute="_compute_all_product_ids",
     )
+    member_product_ids = fields.Many2many(
+        comodel_name="product.product",
+        relation="ir_filters_assortment_member_product_rel",
+        column1="filter_id",
+        column2="product_id",
+        string="Assortment Products (website)",
+        readonly=True,
+        help="Materialized products of the assortment used on the website. It is "
+        "refreshed when the assortment, the products or the partners change.",
+    )
+    member_partner_ids = fields.Many2many(
+        comodel_name="res.partner",
+        relation="ir_filters_assortment_member_partner_rel",
+        column1="filter_id",
+        column2="partner_id",
+        string="Assortment Partners (website)",
+        readonly=True,
+        help="Materialized partners of the assortment used on the website. It is "
+        "refreshed when the assortment, the products or the partners change.",
+    )
 
     @api.depends("domain", "blacklist_product_ids", "whitelist_product_ids")
     def _compute_all_product_ids(self):
@@ -56,3 +78,175 @@ class IrFilters(models.Model):
         for ir_filter in self:
             if ir_filter.apply_on_public_user:
                 ir_filter.all_partner_ids += self.env.ref("base.public_user").partner_id
+
+    @api.model
+    def _get_assortment_refresh_fields(self):
+        """Fields of the assortments that require to refresh their members."""
+        return [
+            "is_assortment",
+            "domain",
+            "blacklist_product_ids",
+            "whitelist_product_ids",
+            "partner_ids",
+            "partner_domain",
+            "apply_on_public_user",
+        ]
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        res = super().create(vals_list)
+        assortments = res.filtered("is_assortment")
+        if assortments:
+            assortments._refresh_assortment_members()
+            # The fields of the assortment domains are cached
+            self.clear_caches()
+        return res
+
+    def write(self, vals):
+        was_assortment = any(self.mapped("is_assortment"))
+        res = super().write(vals)
+        if not was_assortment and not any(self.mapped("is_assortment")):
+            return res
+        if set(vals) & set(self._get_assortment_refresh_fields()):
+            self._refresh_assortment_members()
+            if set(vals) & {"is_assortment", "domain", "partner_domain"}:
+                # The fields of the assortment domains are cached
+                self.clear_caches()
+        return res
+
+    @api.model
+    def _get_partner_assortments(self, partner, website, website_availability):
+        """Get the assortments of the given website availabilities that apply
+        to the partner, looking up the materialized partner members.
+        """
+        return self.sudo().browse(
+            self._get_partner_assortment_ids(
+                partner.id, website.id, tuple(website_availability)
+            )
+        )
+
+    @api.model
+    def _get_partner_assortment_ids(self, partner_id, website_id, website_availability):
+        return tuple(
+            self.sudo()
+            .search(
+                [
+                    ("is_assortment", "=", True),
+                    ("website_availability", "in", list(website_availability)),
+                    ("member_partner_ids", "in", [partner_id]),
+                    "|",
+                    ("website_ids", "=", False),
+                    ("website_ids", "=", website_id),
+                ]
+            )
+            .ids
+        )
+
+    def _get_assortment_products(self, products=None):
+        """Evaluate the assortment product domain, restricted to the given
+        products when it is not a full refresh.
+        """
+        self.ensure_one()
+        domain = self._get_eval_domain()
+        if products is not None:
+            domain = expression.AND([domain, [("id", "in", products.ids)]])
+        return self.env["product.product"].search(domain)
+
+    def _refresh_assortment_members(self, products=None):
+        """Refresh the materialized members of the assortments.
+
+        :param products: if given, only the membership of these products is
+            updated, otherwise the whole assortment is refreshed, partners
+            included.
+        """
+        for record in self.sudo():
+            if not record.is_assortment:
+                record.write(
+                    {"member_product_ids": [(5, 0)], "member_partner_ids": [(5, 0)]}
+                )
+            elif products is None:
+                record.write(
+                    {
+                        "member_product_ids": [
+                            (6, 0, record._get_assortment_products().ids)
+                        ],
+                        "member_partner_ids": [
+                            (
+                                6,
+                                0,
+                                record.with_context(
+                                    active_test=False
+                                ).all_partner_ids.ids,
+                            )
+                        ],
+                    }
+                )
+            else:
+                members = record._get_assortment_products(products)
+                record.member_product_ids = [
+                    (3, product_id) for product_id in (products - members).ids
+                ] + [(4, product_id) for product_id in members.ids]
+
+    def _get_assortment_partners(self, partners):
+        """Same as ``all_partner_ids`` but only evaluated for the given
+        partners, to update the membership of new or modified partners.
+        """
+        self.ensure_one()
+        res = self.partner_ids & partners
+        if self.partner_domain and self.partner_domain != "[]":
+            res |= (
+                self.env["res.partner"]
+                .with_context(active_test=False)
+                .search(
+                    expression.AND(
+                        [
+                            safe_eval(self.partner_domain),
+                            [("id", "in", partners.ids)],
+                        ]
+                    )
+                )
+            )
+        if self.apply_on_public_user:
+            res |= self.env.ref("base.public_user").partner_id & partners
+        return res
+
+    def _refresh_assortment_partners(self, partners):
+        for record in self.sudo().filtered("is_assortment"):
+            members = record._get_assortment_partners(partners)
+            current_members = (
+                record.with_context(active_test=False).member_partner_ids & partners
+            )
+            if members == current_members:
+                continue
+            record.member_partner_ids = [
+                (3, partner_id) for partner_id in (partners - members).ids
+            ] + [(4, partner_id) for partner_id in members.ids]
+
+    @api.model
+    def _cron_refresh_assortment_members(self):
+        self.sudo().search([("is_assortment", "=", True)])._refresh_assortment_members()
+
+    @api.model
+    def _get_domain_field_names(self, domain):
+        return {
+            leaf[0].split(".")[0]
+            for leaf in domain
+            if expression.is_leaf(leaf) and isinstance(leaf[0], str)
+        }
+
+    @api.model
+    @tools.ormcache()
+    def _get_assortment_domain_fields(self):
+        """Fields used by the assortment domains, so writing on products or
+        partners only refreshes the members when one of them changes.
+
+        :return: tuple with the product and the partner field names
+        """
+        product_fields = {"active"}
+        partner_fields = {"active"}
+        for record in self.sudo().search([("is_assortment", "=", True)]):
+            product_fields |= self._get_domain_field_names(record._get_eval_domain())
+            partner_fields |= self._get_domain_field_names(
+                safe_eval(record.partner_domain or "[]")
+            )
+        return frozenset(product_fields), frozenset(partner_fields)
@@ -0,0 +1,35 @@
+# Copyright 2026 Tecnativa - Carlos Roca
+# License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl).
+from odoo import api, fields, models
+
+
+class ProductProduct(models.Model):
+    _inherit = "product.product"
+
+    assortment_member_ids = fields.Many2many(
+        comodel_name="ir.filters",
+        relation="ir_filters_assortment_member_product_rel",
+        column1="product_id",
+        column2="filter_id",
+        string="Website Assortments",
+        readonly=True,
+    )
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        res = super().create(vals_list)
+        res._refresh_assortment_members()
+        return res
+
+    def write(self, vals):
+        res = super().write(vals)
+        product_fields = self.env["ir.filters"]._get_assortment_domain_fields()[0]
+        if set(vals) & product_fields:
+            self._refresh_assortment_members()
+        return res
+
+    def _refresh_assortment_members(self):
+        assortments = (
+            self.env["ir.filters"].sudo().search([("is_assortment", "=", True)])
+        )
+        assortments._refresh_assortment_members(products=self)
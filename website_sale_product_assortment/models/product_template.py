@@ -1,38 +1,107 @@
 # Copyright 2021 Tecnativa - Carlos Roca
 # License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl).
-from odoo import api, models
+from odoo import _, api, models
 
 
 class ProductTemplate(models.Model):
     _inherit = "product.template"
 
+    def write(self, vals):
+        res = super().write(vals)
+        product_fields = self.env["ir.filters"]._get_assortment_domain_fields()[0]
+        if set(vals) & product_fields:
+            self.with_context(
+                active_test=False
+            ).product_variant_ids._refresh_assortment_members()
+        return res
+
     @api.model
     def get_product_assortment_restriction_info(self, product_ids):
         partner = self.env.user.partner_id
         website = self.env["website"].get_current_website()
-        assortments = (
-            self.env["ir.filters"]
-            .sudo()
-            .search(
-                [
-                    ("is_assortment", "=", True),
-                    ("website_availability", "in", ["no_purchase", "no_show"]),
-                    "|",
-                    ("website_ids", "=", website.id),
-                    ("website_ids", "=", False),
-                ]
-            )
+        assortments = self.env["ir.filters"]._get_partner_assortments(
+            partner, website, ["no_purchase", "no_show"]
         )
+        allowed_pairs = self._get_assortment_allowed_pairs(assortments, product_ids)
         assortment_dict = {}
         for assortment in assortments:
-            if partner & assortment.with_context(active_test=False).all_partner_ids:
-                allowed_product_ids = assortment.all_product_ids.ids
-                for product in product_ids:
-                    if product not in allowed_product_ids:
-                        assortment_dict.setdefault(product, self.env["ir.filters"])
-                        assortment_dict[product] |= assortment
+            for product in product_ids:
+                if (assortment.id, product) not in allowed_pairs:
+                    assortment_dict.setdefault(product, self.env["ir.filters"])
+                    assortment_dict[product] |= assortment
         return assortment_dict
 
+    @api.model
+    def _get_assortment_allowed_pairs(self, assortments, product_ids):
+        """Get which of the given variants belong to each assortment with a
+        single query over the materialized assortment members.
+
+        :return: set of ``(assortment_id, product_id)`` tuples
+        """
+        if not assortments or not product_ids:
+            return set()
+        self.env["ir.filters"].flush(["member_product_ids"])
+        self.env.cr.execute(
+            """
+            SELECT filter_id, product_id
+            FROM ir_filters_assortment_member_product_rel
+            WHERE filter_id IN %s AND product_id IN %s
+            """,
+            (tuple(assortments.ids), tuple(product_ids)),
+        )
+        return set(self.env.cr.fetchall())
+
+    @api.model
+    def _get_assortment_restriction_multi(self, product_ids):
+        """Get the assortment restriction of many variants at once.
+
+        :return: dict mapping the restricted variant ids to a dict with the
+            strongest ``product_assortment_type``, and the
+            ``message_unavailable`` and ``assortment_information`` of the first
+            assortment that restricts them.
+        """
+        not_allowed_product_dict = self.get_product_assortment_restriction_info(
+            product_ids
+        )
+        res = {}
+        for product_id, assortments in not_allowed_product_dict.items():
+            res[product_id] = {
+                "product_assortment_type": "no_show"
+                if "no_show" in assortments.mapped("website_availability")
+                else "no_purchase",
+                "message_unavailable": assortments[0].message_unavailable,
+                "assortment_information": assortments[0].assortment_information,
+            }
+        return res
+
+    @api.model
+    def _get_grid_info_enrichers(self):
+        res = super()._get_grid_info_enrichers()
+        res["assortment_preview"] = "_get_grid_info_assortment_preview"
+        return res
+
+    def _get_grid_info_assortment_preview(self, grid_context):
+        """Get the templates of the shop grid that can't be purchased."""
+        res = []
+        restrictions = self._get_assortment_restriction_multi(
+            self.mapped("product_variant_ids.id")
+        )
+        for template in self:
+            variant_ids = template.product_variant_ids.ids
+            if variant_ids and all(
+                variant_id in restrictions for variant_id in variant_ids
+            ):
+                res.append(
+                    {
+                        "id": template.id,
+                        "message_unavailable": restrictions[variant_ids[0]][
+                            "message_unavailable"
+                        ]
+                        or _("Not available"),
+                    }
+                )
+        return res
+
     def _get_combination_info(
         self,
         combination=False,
@@ -52,21 +121,17 @@ class ProductTemplate(models.Model):
         )
         product_res_id = res["product_id"]
         if self.env.context.get("website_id") and not only_template and product_res_id:
-            not_allowed_product_dict = self.get_product_assortment_restriction_info(
-                [product_res_id]
+            restriction = self._get_assortment_restriction_multi([product_res_id]).get(
+                product_res_id
             )
-            if not_allowed_product_dict and product_res_id in not_allowed_product_dict:
+            if restriction:
                 res["product_avoid_purchase"] = True
-                res["product_assortment_type"] = "no_purchase"
-                assortments = not_allowed_product_dict[product_res_id]
-                for assortment in assortments:
-                    if assortment.website_availability == "no_show":
-                        res["product_assortment_type"] = "no_show"
-                        break
+                res["product_assortment_type"] = restriction["product_assortment_type"]
                 if res["product_assortment_type"] != "no_show":
-                    assortment = assortments[0]
-                    res["message_unavailable"] = assortment.message_unavailable
-                    res["assortment_information"] = assortment.assortment_information
+                    res["message_unavailable"] = restriction["message_unavailable"]
+                    res["assortment_information"] = restriction[
+                        "assortment_information"
+                    ]
             else:
                 res["product_avoid_purchase"] = False
         return res
@@ -0,0 +1,26 @@
+# Copyright 2026 Tecnativa - Carlos Roca
+# License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl).
+from odoo import api, models
+
+
+class ResPartner(models.Model):
+    _inherit = "res.partner"
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        res = super().create(vals_list)
+        res._refresh_assortment_members()
+        return res
+
+    def write(self, vals):
+        res = super().write(vals)
+        partner_fields = self.env["ir.filters"]._get_assortment_domain_fields()[1]
+        if set(vals) & partner_fields:
+            self._refresh_assortment_members()
+        return res
+
+    def _refresh_assortment_members(self):
+        assortments = (
+            self.env["ir.filters"].sudo().search([("is_assortment", "=", True)])
+        )
+        assortments._refresh_assortment_partners(self)
@@ -3,6 +3,9 @@ odoo.define("website_sale_product_assortment.assortment_preview", function (requ
 
     const publicWidget = require("web.public.widget");
     const core = require("web.core");
+    const GridInfo = require("website_sale_product_grid_info.grid_info");
+
+    GridInfo.register("assortment_preview");
 
     publicWidget.registry.WebsiteSaleProductAssortment = publicWidget.Widget.extend({
         selector: "#products_grid",
@@ -11,22 +14,18 @@ odoo.define("website_sale_product_assortment.assortment_preview", function (requ
         ],
 
         start: function () {
+            if (GridInfo.isServerRendered()) {
+                return this._super.apply(this, arguments);
+            }
             return $.when.apply($, [
                 this._super.apply(this, arguments),
                 this.render_assortments(),
             ]);
         },
         render_assortments: function () {
-            const $products = $(".o_wsale_product_grid_wrapper");
-            const product_dic = {};
-            $products.each(function () {
-                product_dic[this.querySelector("a img").src.split("/")[6]] = this;
-            });
-            const product_ids = Object.keys(product_dic).map(Number);
-            return this._rpc({
-                route: "/sale/get_info_assortment_preview",
-                params: {product_template_ids: product_ids},
-            }).then((product_values) => {
+            const product_dic = GridInfo.getProductElements();
+            return GridInfo.load().then((grid_info) => {
+                const product_values = grid_info.assortment_preview || [];
                 for (const product of product_values) {
                     this.render_product_assortment(product_dic[product.id], product);
                 }
@@ -1 +1,3 @@
 from . import test_ui
+from . import test_assortment_members
+from . import test_grid_info_rendering
@@ -0,0 +1,101 @@
+# Copyright 2026 Tecnativa - Carlos Roca
+# License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl).
+from unittest.mock import patch
+
+from odoo.tests.common import SavepointCase
+
+
+class TestAssortmentMembers(SavepointCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.partner = cls.env["res.partner"].create({"name": "Test partner"})
+        cls.product_1 = cls.env["product.product"].create(
+            {"name": "Test product 1", "default_code": "ASSORT-1"}
+        )
+        cls.product_2 = cls.env["product.product"].create(
+            {"name": "Test product 2", "default_code": "OTHER-2"}
+        )
+        cls.assortment = cls.env["ir.filters"].create(
+            {
+                "name": "Test Assortment",
+                "model_id": "product.product",
+                "is_assortment": True,
+                "domain": [("default_code", "=like", "ASSORT-%")],
+                "partner_domain": "[('name', '=like', 'Test partner%')]",
+                "website_availability": "no_show",
+            }
+        )
+
+    def test_members_on_assortment_create(self):
+        self.assertEqual(self.assortment.member_product_ids, self.product_1)
+        self.assertIn(self.partner, self.assortment.member_partner_ids)
+
+    def test_members_on_product_change(self):
+        self.product_2.default_code = "ASSORT-2"
+        self.assertEqual(
+            self.assortment.member_product_ids, self.product_1 + self.product_2
+        )
+        self.product_1.default_code = "OTHER-1"
+        self.assertEqual(self.assortment.member_product_ids, self.product_2)
+        product_3 = self.env["product.product"].create(
+            {"name": "Test product 3", "default_code": "ASSORT-3"}
+        )
+        self.assertIn(product_3, self.assortment.member_product_ids)
+
+    def test_members_on_partner_change(self):
+        partner_2 = self.env["res.partner"].create({"name": "Test partner 2"})
+        self.assertIn(partner_2, self.assortment.member_partner_ids)
+        partner_2.name = "Other partner"
+        self.assertNotIn(partner_2, self.assortment.member_partner_ids)
+
+    def test_members_on_domain_change(self):
+        self.assortment.domain = [("default_code", "=like", "OTHER-%")]
+        self.assertEqual(self.assortment.member_product_ids, self.product_2)
+
+    def test_partner_assortments_cache(self):
+        website = self.env["website"].get_current_website()
+        IrFilters = self.env["ir.filters"]
+        self.assertEqual(
+            IrFilters._get_partner_assortments(self.partner, website, ["no_show"]),
+            self.assortment,
+        )
+        self.assertIn(self.assortment, self.product_1.assortment_member_ids)
+        self.assortment.website_availability = "no_purchase"
+        self.assertFalse(
+            IrFilters._get_partner_assortments(self.partner, website, ["no_show"])
+        )
+        partner_2 = self.env["res.partner"].create({"name": "Test partner 2"})
+        self.assertEqual(
+            IrFilters._get_partner_assortments(partner_2, website, ["no_purchase"]),
+            self.assortment,
+        )
+
+    def test_partner_change_keeps_caches(self):
+        IrFilters = type(self.env["ir.filters"])
+        with patch.object(IrFilters, "clear_caches") as mock_clear_caches:
+            partner_2 = self.env["res.partner"].create({"name": "Test partner 2"})
+            partner_2.name = "Other partner"
+            self.assortment.website_availability = "no_purchase"
+        self.assertFalse(mock_clear_caches.called)
+
+    def test_assortment_restriction_multi(self):
+        self.env["ir.filters"].create(
+            {
+                "name": "Test Assortment No Purchase",
+                "model_id": "product.product",
+                "is_assortment": True,
+                "domain": [("id", "=", self.product_1.id)],
+                "partner_domain": "[('id', '=', %s)]" % self.env.user.partner_id.id,
+                "website_availability": "no_purchase",
+                "message_unavailable": "Can't purchase",
+            }
+        )
+        self.assortment.partner_domain = "[('id', '=', %s)]" % (
+            self.env.user.partner_id.id
+        )
+        res = self.env["product.template"]._get_assortment_restriction_multi(
+            (self.product_1 + self.product_2).ids
+        )
+        self.assertNotIn(self.product_1.id, res)
+        self.assertEqual(res[self.product_2.id]["product_assortment_type"], "no_show")
@@ -0,0 +1,37 @@
+# Copyright 2026 Tecnativa - Carlos Roca
+# License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl).
+from odoo.tests import HttpCase, tagged
+
+
+@tagged("post_install", "-at_install")
+class TestGridInfoRendering(HttpCase):
+    def setUp(self):
+        super().setUp()
+        self.template = self.env["product.template"].create(
+            {
+                "name": "Test assortment rendering",
+                "is_published": True,
+                "type": "consu",
+            }
+        )
+        self.env["ir.filters"].create(
+            {
+                "name": "Test Assortment",
+                "model_id": "product.product",
+                "is_assortment": True,
+                "domain": [("id", "!=", self.template.product_variant_id.id)],
+                "partner_domain": "[('id', '=', %s)]"
+                % self.env.ref("base.partner_admin").id,
+                "website_availability": "no_purchase",
+                "message_unavailable": "Test not purchasable",
+            }
+        )
+        self.env.ref("website_sale.products_add_to_cart").active = True
+        self.env["website"].get_current_website().grid_info_server_side = True
+
+    def test_server_side_rendering(self):
+        self.authenticate("admin", "admin")
+        html = self.url_open("/shop?search=Test assortment rendering").text
+        self.assertIn("message_unavailable_%s" % self.template.id, html)
+        self.assertIn("Test not purchasable", html)
+        self.assertIn("a-submit disabled", html)
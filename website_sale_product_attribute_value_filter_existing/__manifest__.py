@@ -3,7 +3,7 @@
 {
     "name": "Website Sale Attribute Value Existing",
     "summary": "Allow hide attributes values not used in variants",
-    "version": "14.0.1.0.0",
+    "version": "14.0.1.1.0",
     "development_status": "Production/Stable",
     "category": "Website",
     "website": "https://github.com/OCA/e-commerce",
@@ -11,6 +11,6 @@
     "license": "LGPL-3",
     "application": False,
     "installable": True,
-    "depends": ["website_sale"],
+    "depends": ["website_sale_shop_facets"],
     "data": ["views/assets.xml", "views/templates.xml"],
 }
@@ -7,27 +7,12 @@ from odoo.addons.website_sale.controllers.main import WebsiteSale
 
 
 class ProductAttributeValues(WebsiteSale):
-    def _get_search_domain(
-        self, search, category, attrib_values, search_in_description=True
-    ):
-        # Store used domain in context to be reused after
-        domain = super()._get_search_domain(
-            search, category, attrib_values, search_in_description=search_in_description
-        )
-        new_context = dict(request.env.context, shop_search_domain=domain)
-        request.context = new_context
-        return domain
-
     @http.route()
     def shop(self, page=0, category=None, search="", ppg=False, **post):
         res = super().shop(page=page, category=category, search=search, ppg=ppg, **post)
-        domain = request.env.context.get("shop_search_domain", [])
-        # Load all products without limit for the filter check on
-        # attribute values
-        templates = request.env["product.template"].search(domain, limit=False)
-        ProductTemplateAttributeLine = request.env["product.template.attribute.line"]
-        attribute_values = ProductTemplateAttributeLine.search(
-            [("product_tmpl_id", "in", templates.ids)]
-        )
-        res.qcontext["attr_values_used"] = attribute_values.mapped("value_ids")
+        # The attribute values used by the products found come from the shop
+        # facets, computed in a single query for the whole search.
+        res.qcontext["attr_values_used"] = request.env[
+            "product.attribute.value"
+        ].browse(list(res.qcontext["shop_facets"].get("attribute_value", {})))
         return res
@@ -0,0 +1,20 @@
+# Copyright 2026 Tecnativa - Carlos Roca
+# License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl).
+{
+    "name": "Website Sale Product Grid Info",
+    "summary": "Load the extra information of the shop products in one request",
+    "version": "14.0.1.1.0",
+    "development_status": "Beta",
+    "category": "Website",
+    "website": "https://github.com/OCA/e-commerce",
+    "author": "Tecnativa, Odoo Community Association (OCA)",
+    "license": "AGPL-3",
+    "application": False,
+    "installable": True,
+    "depends": ["website_sale"],
+    "data": [
+        "views/assets.xml",
+        "views/res_config_settings_views.xml",
+        "views/templates.xml",
+    ],
+}
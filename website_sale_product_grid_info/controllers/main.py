@@ -0,0 +1,35 @@
+# Copyright 2026 Tecnativa - Carlos Roca
+# License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl).
+from odoo import http
+from odoo.http import request
+
+from odoo.addons.website_sale.controllers.main import WebsiteSale
+
+
+class WebsiteSaleProductGridInfo(http.Controller):
+    @http.route(
+        ["/shop/grid_info"],
+        type="json",
+        auth="public",
+        methods=["POST"],
+        website=True,
+    )
+    def grid_info(self, product_template_ids, enrichers=None, **kw):
+        """Get the information of all the grid enrichers in one request."""
+        templates = (
+            request.env["product.template"]
+            .sudo()
+            .browse(product_template_ids)
+            .filtered(lambda t: t.is_published)
+        )
+        return templates._get_grid_info(enrichers)
+
+
+class WebsiteSale(WebsiteSale):
+    @http.route()
+    def shop(self, page=0, category=None, search="", ppg=False, **post):
+        res = super().shop(page=page, category=category, search=search, ppg=ppg, **post)
+        products = res.qcontext.get("products")
+        if request.website.grid_info_server_side and products:
+            res.qcontext["grid_info"] = products.sudo()._get_grid_info_by_template()
+        return res
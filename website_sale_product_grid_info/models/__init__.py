@@ -0,0 +1,3 @@
+from . import product_template
+from . import res_config_settings
+from . import website
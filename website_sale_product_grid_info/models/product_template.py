@@ -0,0 +1,58 @@
+# Copyright 2026 Tecnativa - Carlos Roca
+# License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl).
+from odoo import api, models
+
+
+class ProductTemplate(models.Model):
+    _inherit = "product.template"
+
+    @api.model
+    def _get_grid_info_enrichers(self):
+        """Hook for registering the batch enrichers of the shop grid.
+
+        :return: dict mapping the enricher names to the name of the template
+            method that computes their information. The method receives the
+            grid context, see ``_prepare_grid_info_context``.
+        """
+        return {}
+
+    @api.model
+    def _prepare_grid_info_context(self):
+        """Values resolved once and shared by all the grid enrichers."""
+        website = self.env["website"].get_current_website()
+        return {
+            "website": website,
+            "pricelist": website.get_current_pricelist(),
+            "partner": self.env.user.partner_id,
+        }
+
+    def _get_grid_info(self, enrichers=None):
+        """Compute the information of the given enrichers for all the templates.
+
+        :param enrichers: names of the enrichers to compute, all the
+            registered ones by default.
+        :return: dict mapping the enricher names to their information.
+        """
+        available_enrichers = self._get_grid_info_enrichers()
+        if enrichers is None:
+            enrichers = list(available_enrichers)
+        grid_context = self._prepare_grid_info_context()
+        # Read the variants of all the templates at once for the enrichers
+        self.mapped("product_variant_ids")
+        return {
+            name: getattr(self, available_enrichers[name])(grid_context)
+            for name in enrichers
+            if name in available_enrichers
+        }
+
+    def _get_grid_info_by_template(self, enrichers=None):
+        """Same as ``_get_grid_info``, but indexed by template for rendering
+        the information in the shop templates.
+
+        :return: dict mapping the enricher names to dicts mapping the
+            template ids to their information.
+        """
+        return {
+            name: {values["id"]: values for values in result}
+            for name, result in self._get_grid_info(enrichers).items()
+        }
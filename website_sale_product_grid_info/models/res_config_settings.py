@@ -0,0 +1,11 @@
+# Copyright 2026 Tecnativa - Carlos Roca
+# License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl).
+from odoo import fields, models
+
+
+class ResConfigSettings(models.TransientModel):
+    _inherit = "res.config.settings"
+
+    grid_info_server_side = fields.Boolean(
+        related="website_id.grid_info_server_side", readonly=False
+    )
@@ -0,0 +1,13 @@
+# Copyright 2026 Tecnativa - Carlos Roca
+# License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl).
+from odoo import fields, models
+
+
+class Website(models.Model):
+    _inherit = "website"
+
+    grid_info_server_side = fields.Boolean(
+        string="Render shop grid info on server",
+        help="Compute the extra information of the shop products while "
+        "rendering the page instead of loading it afterwards from the browser.",
+    )
@@ -0,0 +1,68 @@
+/* Copyright 2026 Tecnativa - Carlos Roca
+ * License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl). */
+odoo.define("website_sale_product_grid_info.grid_info", function (require) {
+    "use strict";
+
+    const ajax = require("web.ajax");
+
+    const enrichers = [];
+    let gridInfoPromise = null;
+
+    /**
+     * Get the product grid elements by product template id.
+     *
+     * @returns {Object}
+     */
+    function getProductElements() {
+        const product_dic = {};
+        $(".o_wsale_product_grid_wrapper").each(function () {
+            product_dic[this.querySelector("a img").src.split("/")[6]] = this;
+        });
+        return product_dic;
+    }
+
+    /**
+     * Whether the grid information has been already rendered by the server.
+     *
+     * @returns {Boolean}
+     */
+    function isServerRendered() {
+        return Boolean($("#products_grid").data("grid-info-rendered"));
+    }
+
+    /**
+     * Register an enricher to be loaded with the grid information.
+     *
+     * @param {String} name
+     */
+    function register(name) {
+        enrichers.push(name);
+    }
+
+    /**
+     * Load the information of all the registered enrichers in one request,
+     * shared by all the widgets of the page.
+     *
+     * @returns {Promise}
+     */
+    function load() {
+        if (isServerRendered()) {
+            return Promise.resolve({});
+        }
+        if (!gridInfoPromise) {
+            const product_ids = Object.keys(getProductElements()).map(Number);
+            gridInfoPromise = ajax.jsonRpc("/shop/grid_info", "call", {
+                product_template_ids: product_ids,
+                enrichers: enrichers,
+            });
+        }
+        return gridInfoPromise;
+    }
+
+    return {
+        getProductElements: getProductElements,
+        isServerRendered: isServerRendered,
+        register: register,
+        load: load,
+    };
+});
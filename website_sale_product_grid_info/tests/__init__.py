@@ -0,0 +1,2 @@
+from . import test_grid_info
+from . import test_grid_info_rendering
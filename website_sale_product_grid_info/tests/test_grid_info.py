@@ -0,0 +1,46 @@
+# Copyright 2026 Tecnativa - Carlos Roca
+# License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl).
+from unittest.mock import patch
+
+from odoo.tests import SavepointCase, tagged
+
+from odoo.addons.website.tools import MockRequest
+
+
+@tagged("post_install", "-at_install")
+class TestGridInfo(SavepointCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.templates = cls.env["product.template"].create(
+            [
+                {"name": "Test grid info 1", "is_published": True},
+                {"name": "Test grid info 2", "is_published": True},
+            ]
+        )
+        cls.website = cls.env["website"].get_current_website()
+
+    def _get_grid_info_test(self, grid_context):
+        return [{"id": template.id, "name": template.name} for template in self]
+
+    def test_grid_info_enrichers(self):
+        product_template_model = type(self.env["product.template"])
+        product_template_model._get_grid_info_test = self._get_grid_info_test.__func__
+        self.addCleanup(delattr, product_template_model, "_get_grid_info_test")
+        with patch.object(
+            product_template_model,
+            "_get_grid_info_enrichers",
+            return_value={"test": "_get_grid_info_test"},
+        ), MockRequest(self.env, website=self.website):
+            res = self.templates._get_grid_info()
+            self.assertEqual(
+                res,
+                {"test": [{"id": t.id, "name": t.name} for t in self.templates]},
+            )
+            res = self.templates._get_grid_info_by_template()
+            self.assertEqual(
+                res["test"][self.templates[0].id],
+                {"id": self.templates[0].id, "name": "Test grid info 1"},
+            )
+            # Enrichers not registered are ignored
+            self.assertEqual(self.templates._get_grid_info(["unknown"]), {})
@@ -0,0 +1,27 @@
+# Copyright 2026 Tecnativa - Carlos Roca
+# License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl).
+from odoo.tests import HttpCase, tagged
+
+
+@tagged("post_install", "-at_install")
+class TestGridInfoRendering(HttpCase):
+    def setUp(self):
+        super().setUp()
+        self.env["product.template"].create(
+            {"name": "Test grid info rendering", "is_published": True}
+        )
+        self.env.ref("website_sale.products_add_to_cart").active = True
+        self.website = self.env["website"].get_current_website()
+
+    def _get_shop_html(self):
+        return self.url_open("/shop?search=Test grid info rendering").text
+
+    def test_server_side_rendering(self):
+        self.assertNotIn('data-grid-info-rendered="1"', self._get_shop_html())
+        self.website.grid_info_server_side = True
+        html = self._get_shop_html()
+        self.assertIn('data-grid-info-rendered="1"', html)
+        self.assertIn("Test grid info rendering", html)
+        # No enricher disables or hides the add to cart button
+        self.assertNotIn("a-submit disabled", html)
+        self.assertNotIn("fa-shopping-cart d-none", html)
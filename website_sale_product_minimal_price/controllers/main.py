@@ -19,28 +19,13 @@ class WebsiteSaleVariantController(VariantController):
         """Special route to use website logic in get_combination_info override.
         This route is called in JS by appending _website to the base route.
         """
-        res = []
-        templates = request.env["product.template"].sudo().browse(product_template_ids)
-        pricelist = request.env["website"].get_current_website().get_current_pricelist()
-        for template in templates.filtered(lambda t: t.is_published):
-            product_id, add_qty, has_distinct_price = template._get_cheapest_info(
-                pricelist
-            )
-            combination = template._get_combination_info(
-                product_id=product_id, add_qty=add_qty, pricelist=pricelist
-            )
-            res.append(
-                {
-                    "id": template.id,
-                    "price": combination.get("price"),
-                    "distinct_prices": has_distinct_price,
-                    "currency": {
-                        "position": template.currency_id.position,
-                        "symbol": template.currency_id.symbol,
-                    },
-                }
-            )
-        return res
+        templates = (
+            request.env["product.template"]
+            .sudo()
+            .browse(product_template_ids)
+            .filtered(lambda t: t.is_published)
+        )
+        return templates._get_grid_info(["minimal_price"])["minimal_price"]
 
     @http.route(
         ["/sale/get_combination_info_pricelist_atributes"],
@@ -53,40 +38,37 @@ class WebsiteSaleVariantController(VariantController):
         This route is called in JS by appending _website to the base route.
         """
         product = request.env["product.product"].browse(product_id)
+        return self.get_combination_info_price_scale([product.id])[product.id]
+
+    @http.route(
+        ["/sale/get_combination_info_price_scale"],
+        type="json",
+        auth="public",
+        website=True,
+    )
+    def get_combination_info_price_scale(self, product_ids, **kwargs):
+        """Get the quantity price scale of several variants in one call.
+
+        :return: dict mapping the variant ids to the price scale and the name
+            of their unit of measure.
+        """
+        products = request.env["product.product"].browse(product_ids)
         pricelist = request.env["website"].get_current_website().get_current_pricelist()
-        # Getting all min_quantity of the current product to compute the possible
-        # price scale.
-        qty_list = request.env["product.pricelist.item"].search(
-            [
-                "|",
-                ("product_id", "=", product.id),
-                "|",
-                ("product_tmpl_id", "=", product.product_tmpl_id.id),
-                (
-                    "categ_id",
-                    "in",
-                    list(map(int, product.categ_id.parent_path.split("/")[0:-1])),
-                ),
-                ("min_quantity", ">", 0),
-            ]
-        )
-        qty_list = sorted(set(qty_list.mapped("min_quantity")))
-        res = []
-        ctx = dict(request.env.context, pricelist=pricelist.id, quantity=0)
-        last_price = product.with_context(ctx).price
-        for min_qty in qty_list:
-            ctx["quantity"] = min_qty
-            new_price = product.with_context(ctx).price
-            if new_price != last_price:
-                res.append(
+        price_scales = products._get_price_scale_multi(pricelist)
+        res = {}
+        for product in products:
+            res[product.id] = (
+                [
                     {
                         "min_qty": min_qty,
-                        "price": new_price,
+                        "price": price,
                         "currency": {
                             "position": product.currency_id.position,
                             "symbol": product.currency_id.symbol,
                         },
                     }
-                )
-                last_price = new_price
-        return (res, product.uom_name)
+                    for min_qty, price in price_scales[product.id]
+                ],
+                product.uom_name,
+            )
+        return res
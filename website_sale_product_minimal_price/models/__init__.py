@@ -1 +1,4 @@
+from . import product_pricelist
+from . import product_pricelist_item
+from . import product_product
 from . import product_template
@@ -0,0 +1,81 @@
+# Copyright 2026 Tecnativa - Carlos Roca
+# License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl).
+from collections import defaultdict
+
+from odoo import models, tools
+
+
+class ProductPricelist(models.Model):
+    _inherit = "product.pricelist"
+
+    def _clear_pricelist_closure_index(self):
+        self._get_pricelist_closure_index.clear_cache(self)
+
+    @tools.ormcache("self.id")
+    def _get_pricelist_closure_index(self):
+        """Index of the pricelists reachable from this one through rules based
+        on other pricelists.
+
+        It is built once and kept until a pricelist item changes, so the
+        chain of pricelists does not have to be walked for every template.
+
+        :return: dict mapping each reachable pricelist id to a tuple
+            ``(base_rules, variant_items)`` where ``base_rules`` maps
+            ``(applied_on, target_id)`` to the base pricelist ids and
+            ``variant_items`` maps variant ids to the pricelist item ids.
+        """
+        self.ensure_one()
+        item_model = self.env["product.pricelist.item"].sudo()
+        index = {}
+        next_pricelist_ids = {self.id}
+        while next_pricelist_ids:
+            index.update(
+                {
+                    pricelist_id: (defaultdict(list), defaultdict(list))
+                    for pricelist_id in next_pricelist_ids
+                }
+            )
+            items = item_model.search_read(
+                [("pricelist_id", "in", list(next_pricelist_ids))],
+                [
+                    "pricelist_id",
+                    "applied_on",
+                    "categ_id",
+                    "product_tmpl_id",
+                    "product_id",
+                    "compute_price",
+                    "base",
+                    "base_pricelist_id",
+                ],
+            )
+            next_pricelist_ids = set()
+            for item in items:
+                base_rules, variant_items = index[item["pricelist_id"][0]]
+                if item["product_id"]:
+                    variant_items[item["product_id"][0]].append(item["id"])
+                if not (
+                    item["compute_price"] == "formula"
+                    and item["base"] == "pricelist"
+                    and item["base_pricelist_id"]
+                ):
+                    continue
+                target = self._get_pricelist_closure_target(item)
+                base_pricelist_id = item["base_pricelist_id"][0]
+                base_rules[(item["applied_on"], target)].append(base_pricelist_id)
+                if base_pricelist_id not in index:
+                    next_pricelist_ids.add(base_pricelist_id)
+        return {
+            pricelist_id: (dict(base_rules), dict(variant_items))
+            for pricelist_id, (base_rules, variant_items) in index.items()
+        }
+
+    def _get_pricelist_closure_target(self, item):
+        """Record the item read in ``_get_pricelist_closure_index`` applies to."""
+        field = {
+            "2_product_category": "categ_id",
+            "1_product": "product_tmpl_id",
+            "0_product_variant": "product_id",
+        }.get(item["applied_on"])
+        if not field or not item[field]:
+            return False
+        return item[field][0]
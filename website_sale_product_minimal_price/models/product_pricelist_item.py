@@ -0,0 +1,23 @@
+# Copyright 2026 Tecnativa - Carlos Roca
+# License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl).
+from odoo import api, models
+
+
+class ProductPricelistItem(models.Model):
+    _inherit = "product.pricelist.item"
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        res = super().create(vals_list)
+        self.env["product.pricelist"]._clear_pricelist_closure_index()
+        return res
+
+    def write(self, vals):
+        res = super().write(vals)
+        self.env["product.pricelist"]._clear_pricelist_closure_index()
+        return res
+
+    def unlink(self):
+        res = super().unlink()
+        self.env["product.pricelist"]._clear_pricelist_closure_index()
+        return res
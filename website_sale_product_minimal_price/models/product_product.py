@@ -0,0 +1,86 @@
+# Copyright 2026 Tecnativa - Carlos Roca
+# License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl).
+from odoo import models
+
+
+class ProductProduct(models.Model):
+    _inherit = "product.product"
+
+    def _get_price_scale_quantities(self):
+        """Get the minimum quantities of the pricelist items that may define a
+        price break for each variant, with a single search for all of them.
+
+        :return: dict mapping variant ids to a sorted list of quantities
+        """
+        categ_ids_by_product = {
+            product.id: [int(x) for x in product.categ_id.parent_path.split("/")[:-1]]
+            for product in self
+        }
+        items = self.env["product.pricelist.item"].search_read(
+            [
+                "|",
+                ("product_id", "in", self.ids),
+                "|",
+                ("product_tmpl_id", "in", self.mapped("product_tmpl_id").ids),
+                (
+                    "categ_id",
+                    "in",
+                    list(set().union(*categ_ids_by_product.values())),
+                ),
+                ("min_quantity", ">", 0),
+            ],
+            ["product_id", "product_tmpl_id", "categ_id", "min_quantity"],
+        )
+        res = {}
+        for product in self:
+            categ_ids = categ_ids_by_product[product.id]
+            res[product.id] = sorted(
+                {
+                    item["min_quantity"]
+                    for item in items
+                    if (item["product_id"] and item["product_id"][0] == product.id)
+                    or (
+                        item["product_tmpl_id"]
+                        and item["product_tmpl_id"][0] == product.product_tmpl_id.id
+                    )
+                    or (item["categ_id"] and item["categ_id"][0] in categ_ids)
+                }
+            )
+        return res
+
+    def _get_price_scale_multi(self, pricelist):
+        """Get the quantity price breaks of several variants at once.
+
+        The result is not cached, as the prices depend on the date and the
+        partner through the pricelist rules.
+
+        :return: dict mapping variant ids to a list of ``(min_qty, price)``
+            with only the quantities where the price changes.
+        """
+        uom_id = self.env.context.get("uom", False)
+        quantities_by_product = self._get_price_scale_quantities()
+        partner = self.env.context.get("partner", False)
+        # The pricelist engine evaluates one quantity per variant at a time, so
+        # do one pass by distinct quantity for all the variants that use it.
+        prices_by_qty = {}
+        for qty in sorted(set().union([0], *quantities_by_product.values())):
+            products = self.filtered(
+                lambda p: not qty or qty in quantities_by_product[p.id]
+            )
+            prices_by_qty[qty] = pricelist.get_products_price(
+                products,
+                [qty] * len(products),
+                [partner] * len(products),
+                uom_id=uom_id,
+            )
+        res = {}
+        for product in self:
+            scale = []
+            last_price = prices_by_qty[0].get(product.id, 0.0)
+            for min_qty in quantities_by_product[product.id]:
+                new_price = prices_by_qty[min_qty].get(product.id, 0.0)
+                if new_price != last_price:
+                    scale.append((min_qty, new_price))
+                    last_price = new_price
+            res[product.id] = scale
+        return res
@@ -2,64 +2,67 @@
 # Copyright 2020 Tecnativa - Pedro M. Baeza
 # Copyright 2021 Tecnativa - Carlos Roca
 # License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl).
-from odoo import models
+from odoo import api, models
+
+CHEAPEST_INFO_QUANTITIES = [1, 99999999]
 
 
 class ProductTemplate(models.Model):
     _inherit = "product.template"
 
-    def _get_product_subpricelists(self, pricelist_id):
-        return pricelist_id.item_ids.filtered(
-            lambda i: (
-                i.applied_on == "3_global"
-                or (
-                    i.applied_on == "2_product_category" and i.categ_id == self.categ_id
-                )
-                or (i.applied_on == "1_product" and i.product_tmpl_id == self)
-                or (
-                    i.applied_on == "0_product_variant"
-                    and i.product_id in self.product_variant_ids
-                )
-            )
-            and i.compute_price == "formula"
-            and i.base == "pricelist"
-        ).mapped("base_pricelist_id")
+    def _get_pricelist_closure_keys(self):
+        """Keys of the pricelist closure index rules that apply to this
+        template, see ``product.pricelist._get_pricelist_closure_index``.
+        """
+        self.ensure_one()
+        return [
+            ("3_global", False),
+            ("2_product_category", self.categ_id.id),
+            ("1_product", self.id),
+        ] + [
+            ("0_product_variant", product_id)
+            for product_id in self.product_variant_ids.ids
+        ]
 
-    def _get_variants_from_pricelist(self, pricelist_ids):
-        return pricelist_ids.mapped("item_ids").filtered(
-            lambda i: i.product_id in self.product_variant_ids
-        )
+    def _get_pricelist_variant_items_multi(self, pricelist_id):
+        """Get the variant pricelist items that affect each template, following
+        the chain of based on pricelist rules through the cached pricelist
+        closure index.
 
-    def _get_pricelist_variant_items(self, pricelist_id):
-        res = self._get_variants_from_pricelist(pricelist_id)
-        next_pricelists = self._get_product_subpricelists(pricelist_id)
-        res |= self._get_variants_from_pricelist(next_pricelists)
-        visited_pricelists = pricelist_id
-        while next_pricelists:
-            pricelist = next_pricelists[0]
-            if pricelist not in visited_pricelists:
-                res |= self._get_variants_from_pricelist(pricelist)
-                next_pricelists |= self._get_product_subpricelists(pricelist)
-                next_pricelists -= pricelist
-                visited_pricelists |= pricelist
-            else:
-                next_pricelists -= pricelist
+        :return: dict mapping template ids to ``product.pricelist.item`` records
+        """
+        index = pricelist_id._get_pricelist_closure_index()
+        item_model = self.env["product.pricelist.item"]
+        res = {}
+        for template in self:
+            keys = template._get_pricelist_closure_keys()
+            variant_item_ids = []
+            visited_pricelist_ids = set()
+            next_pricelist_ids = [pricelist_id.id]
+            while next_pricelist_ids:
+                next_pricelist_id = next_pricelist_ids.pop(0)
+                if next_pricelist_id in visited_pricelist_ids:
+                    continue
+                visited_pricelist_ids.add(next_pricelist_id)
+                base_rules, variant_items = index[next_pricelist_id]
+                for product_id in template.product_variant_ids.ids:
+                    variant_item_ids += variant_items.get(product_id, [])
+                for key in keys:
+                    next_pricelist_ids += base_rules.get(key, [])
+            res[template.id] = item_model.browse(variant_item_ids)
         return res
 
-    def _get_cheapest_info(self, pricelist):
-        """Helper method for getting the variant with lowest price."""
-        # TODO: Cache this method for getting better performance
+    def _get_pricelist_variant_items(self, pricelist_id):
+        self.ensure_one()
+        return self._get_pricelist_variant_items_multi(pricelist_id)[self.id]
+
+    def _get_cheapest_info_candidates(self, variant_items):
+        """Variants whose price has to be computed to know the cheapest one."""
         self.ensure_one()
-        context = dict(self.env.context, pricelist=pricelist.id)
-        min_price = 99999999
-        product_id = False
-        add_qty = 0
-        has_distinct_price = False
         # Variants with extra price
         variants_extra_price = self.product_variant_ids.filtered("price_extra")
         variants_without_extra_price = self.product_variant_ids - variants_extra_price
         # Avoid compute prices when pricelist has not item variants defined
-        variant_items = self._get_pricelist_variant_items(pricelist)
         if variant_items:
             # Take into account only the variants defined in pricelist and one
             # variant not defined to compute prices defined at template or
@@ -70,19 +73,88 @@ class ProductTemplate(models.Model):
         else:
             products = variants_without_extra_price[:1]
         products |= variants_extra_price
-        for product in products:
-            for qty in [1, 99999999]:
-                context = dict(context, quantity=qty)
-                product_price = product.with_context(context).price
-                if product_price != min_price and min_price != 99999999:
-                    # Mark if there are different prices iterating over
-                    # variants and comparing qty 1 and maximum qty
-                    has_distinct_price = True
-                if product_price < min_price:
-                    min_price = product_price
-                    add_qty = qty
-                    product_id = product.id
-        return product_id, add_qty, has_distinct_price
+        return products
+
+    def _get_cheapest_info(self, pricelist):
+        """Helper method for getting the variant with lowest price."""
+        self.ensure_one()
+        return self._get_cheapest_info_multi(pricelist)[self.id]
+
+    def _get_cheapest_info_multi(self, pricelist):
+        """Get the variant with lowest price for all the templates at once.
+
+        The result is not cached: it depends on the date, the currency rates
+        and the partner through the pricelist rules.
+
+        :return: dict mapping template ids to
+            ``(product_id, add_qty, has_distinct_price)``
+        """
+        variant_items = self._get_pricelist_variant_items_multi(pricelist)
+        products_by_template = {}
+        all_products = self.env["product.product"]
+        for template in self:
+            products = template._get_cheapest_info_candidates(
+                variant_items[template.id]
+            )
+            products_by_template[template.id] = products
+            all_products |= products
+        # Compute the prices of all the candidates in one pricelist pass by
+        # quantity instead of one per variant and quantity.
+        partner = self.env.context.get("partner", False)
+        prices_by_qty = {
+            qty: pricelist.get_products_price(
+                all_products, [qty] * len(all_products), [partner] * len(all_products)
+            )
+            for qty in CHEAPEST_INFO_QUANTITIES
+        }
+        res = {}
+        for template in self:
+            min_price = 99999999
+            product_id = False
+            add_qty = 0
+            has_distinct_price = False
+            for product in products_by_template[template.id]:
+                for qty in CHEAPEST_INFO_QUANTITIES:
+                    product_price = prices_by_qty[qty].get(product.id, 0.0)
+                    if product_price != min_price and min_price != 99999999:
+                        # Mark if there are different prices iterating over
+                        # variants and comparing qty 1 and maximum qty
+                        has_distinct_price = True
+                    if product_price < min_price:
+                        min_price = product_price
+                        add_qty = qty
+                        product_id = product.id
+            res[template.id] = (product_id, add_qty, has_distinct_price)
+        return res
+
+    @api.model
+    def _get_grid_info_enrichers(self):
+        res = super()._get_grid_info_enrichers()
+        res["minimal_price"] = "_get_grid_info_minimal_price"
+        return res
+
+    def _get_grid_info_minimal_price(self, grid_context):
+        """Get the minimal price of the templates for the shop grid."""
+        res = []
+        pricelist = grid_context["pricelist"]
+        cheapest_info = self._get_cheapest_info_multi(pricelist)
+        for template in self:
+            product_id, add_qty, has_distinct_price = cheapest_info[template.id]
+            combination = template._get_combination_info(
+                product_id=product_id, add_qty=add_qty, pricelist=pricelist
+            )
+            res.append(
+                {
+                    "id": template.id,
+                    "price": combination.get("price"),
+                    "distinct_prices": has_distinct_price,
+                    "currency": {
+                        "position": template.currency_id.position,
+                        "symbol": template.currency_id.symbol,
+                    },
+                }
+            )
+        return res
 
     def _get_first_possible_combination(
         self, parent_combination=None, necessary_values=None
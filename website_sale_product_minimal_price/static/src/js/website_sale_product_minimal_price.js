@@ -4,6 +4,9 @@ odoo.define("website_sale_product_minimal_price.shop_min_price", function (requi
     const publicWidget = require("web.public.widget");
     const core = require("web.core");
     const field_utils = require("web.field_utils");
+    const GridInfo = require("website_sale_product_grid_info.grid_info");
+
+    GridInfo.register("minimal_price");
 
     publicWidget.registry.WebsiteSaleProductMinimalPrice = publicWidget.Widget.extend({
         selector: "#products_grid",
@@ -12,22 +15,18 @@ odoo.define("website_sale_product_minimal_price.shop_min_price", function (requi
         ],
 
         start: function () {
+            if (GridInfo.isServerRendered()) {
+                return this._super.apply(this, arguments);
+            }
             return Promise.all([
                 this._super.apply(this, arguments),
                 this.render_price(),
             ]);
         },
         render_price: function () {
-            const $products = $(".o_wsale_product_grid_wrapper");
-            const product_dic = {};
-            $products.each(function () {
-                product_dic[this.querySelector("a img").src.split("/")[6]] = this;
-            });
-            const product_ids = Object.keys(product_dic).map(Number);
-            return this._rpc({
-                route: "/sale/get_combination_info_minimal_price/",
-                params: {product_template_ids: product_ids},
-            }).then((products_min_price) => {
+            const product_dic = GridInfo.getProductElements();
+            return GridInfo.load().then((grid_info) => {
+                const products_min_price = grid_info.minimal_price || [];
                 for (const product of products_min_price) {
                     if (!product.distinct_prices) {
                         continue;
@@ -1,2 +1,4 @@
 from . import test_website_sale_product_minimal_price
 from . import test_product_with_no_prices
+from . import test_cheapest_info
+from . import test_grid_info_rendering
@@ -0,0 +1,214 @@
+# Copyright 2026 Tecnativa - Carlos Roca
+# License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl).
+from datetime import timedelta
+
+from odoo import fields
+from odoo.tests.common import SavepointCase
+
+
+class TestCheapestInfo(SavepointCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        ProductAttribute = cls.env["product.attribute"]
+        ProductAttributeValue = cls.env["product.attribute.value"]
+        cls.product_attribute = ProductAttribute.create(
+            {"name": "Test", "create_variant": "always"}
+        )
+        cls.product_attribute_value_test_1 = ProductAttributeValue.create(
+            {"name": "Test v1", "attribute_id": cls.product_attribute.id}
+        )
+        cls.product_attribute_value_test_2 = ProductAttributeValue.create(
+            {"name": "Test v2", "attribute_id": cls.product_attribute.id}
+        )
+        cls.product_template = cls.env["product.template"].create(
+            {
+                "name": "My product test with cheapest info",
+                "list_price": 100.0,
+                "attribute_line_ids": [
+                    (
+                        0,
+                        0,
+                        {
+                            "attribute_id": cls.product_attribute.id,
+                            "value_ids": [
+                                (4, cls.product_attribute_value_test_1.id),
+                                (4, cls.product_attribute_value_test_2.id),
+                            ],
+                        },
+                    ),
+                ],
+            }
+        )
+        cls.variant_1 = cls.product_template.product_variant_ids[0]
+        cls.variant_2 = cls.product_template.product_variant_ids[1]
+        cls.pricelist = cls.env["product.pricelist"].create(
+            {"name": "Test pricelist", "currency_id": cls.env.company.currency_id.id}
+        )
+
+    def test_cheapest_info_cache_invalidation(self):
+        res = self.product_template._get_cheapest_info(self.pricelist)
+        self.assertEqual(res[0], self.variant_1.id)
+        self.assertFalse(res[2])
+        # A new pricelist item must invalidate the cached result
+        self.env["product.pricelist.item"].create(
+            {
+                "pricelist_id": self.pricelist.id,
+                "applied_on": "0_product_variant",
+                "product_id": self.variant_2.id,
+                "compute_price": "fixed",
+                "fixed_price": 10.0,
+            }
+        )
+        res = self.product_template._get_cheapest_info(self.pricelist)
+        self.assertEqual(res[0], self.variant_2.id)
+        self.assertTrue(res[2])
+
+    def test_cheapest_info_item_dates(self):
+        tomorrow = fields.Datetime.now() + timedelta(days=1)
+        self.env["product.pricelist.item"].create(
+            {
+                "pricelist_id": self.pricelist.id,
+                "applied_on": "0_product_variant",
+                "product_id": self.variant_2.id,
+                "compute_price": "fixed",
+                "fixed_price": 10.0,
+                "date_start": tomorrow,
+                "date_end": tomorrow + timedelta(days=1),
+            }
+        )
+        self.assertEqual(
+            self.product_template._get_cheapest_info(self.pricelist)[0],
+            self.variant_1.id,
+        )
+        # Once the item window opens its price applies
+        self.assertEqual(
+            self.product_template.with_context(date=tomorrow)._get_cheapest_info(
+                self.pricelist
+            )[0],
+            self.variant_2.id,
+        )
+
+    def test_cheapest_info_price_extra_invalidation(self):
+        self.assertEqual(
+            self.product_template._get_cheapest_info(self.pricelist)[0],
+            self.variant_1.id,
+        )
+        self.variant_1.product_template_attribute_value_ids.price_extra = 50.0
+        res = self.product_template._get_cheapest_info(self.pricelist)
+        self.assertEqual(res[0], self.variant_2.id)
+        self.assertTrue(res[2])
+
+    def test_cheapest_info_multi(self):
+        product_template_2 = self.product_template.copy({"name": "Other test"})
+        variant_2_1 = product_template_2.product_variant_ids[0]
+        self.env["product.pricelist.item"].create(
+            {
+                "pricelist_id": self.pricelist.id,
+                "applied_on": "0_product_variant",
+                "product_id": self.variant_2.id,
+                "compute_price": "fixed",
+                "fixed_price": 10.0,
+            }
+        )
+        templates = self.product_template + product_template_2
+        res = templates._get_cheapest_info_multi(self.pricelist)
+        self.assertEqual(res[self.product_template.id], (self.variant_2.id, 1, True))
+        self.assertEqual(res[product_template_2.id], (variant_2_1.id, 1, False))
+        for template in templates:
+            self.assertEqual(
+                res[template.id],
+                template._get_cheapest_info(self.pricelist),
+            )
+
+    def test_pricelist_variant_items_through_base_pricelist(self):
+        pricelist_aux = self.env["product.pricelist"].create(
+            {
+                "name": "Test pricelist Aux",
+                "item_ids": [
+                    (
+                        0,
+                        0,
+                        {
+                            "applied_on": "0_product_variant",
+                            "product_id": self.variant_2.id,
+                            "compute_price": "fixed",
+                            "fixed_price": 10.0,
+                        },
+                    )
+                ],
+            }
+        )
+        self.assertFalse(
+            self.product_template._get_pricelist_variant_items(self.pricelist)
+        )
+        self.env["product.pricelist.item"].create(
+            {
+                "pricelist_id": self.pricelist.id,
+                "applied_on": "2_product_category",
+                "categ_id": self.product_template.categ_id.id,
+                "compute_price": "formula",
+                "base": "pricelist",
+                "base_pricelist_id": pricelist_aux.id,
+            }
+        )
+        index = self.pricelist._get_pricelist_closure_index()
+        self.assertEqual(set(index), {self.pricelist.id, pricelist_aux.id})
+        self.assertEqual(
+            self.product_template._get_pricelist_variant_items(self.pricelist),
+            pricelist_aux.item_ids,
+        )
+        self.assertEqual(
+            self.product_template._get_cheapest_info(self.pricelist)[0],
+            self.variant_2.id,
+        )
+
+    def test_price_scale_multi(self):
+        self.env["product.pricelist.item"].create(
+            [
+                {
+                    "pricelist_id": self.pricelist.id,
+                    "applied_on": "1_product",
+                    "product_tmpl_id": self.product_template.id,
+                    "min_quantity": 10,
+                    "compute_price": "fixed",
+                    "fixed_price": 90.0,
+                },
+                {
+                    "pricelist_id": self.pricelist.id,
+                    "applied_on": "0_product_variant",
+                    "product_id": self.variant_2.id,
+                    "min_quantity": 20,
+                    "compute_price": "fixed",
+                    "fixed_price": 80.0,
+                },
+            ]
+        )
+        products = self.variant_1 + self.variant_2
+        res = products._get_price_scale_multi(self.pricelist)
+        self.assertEqual(res[self.variant_1.id], [(10, 90.0)])
+        self.assertEqual(res[self.variant_2.id], [(10, 90.0), (20, 80.0)])
+
+    def test_price_scale_item_dates(self):
+        tomorrow = fields.Datetime.now() + timedelta(days=1)
+        self.env["product.pricelist.item"].create(
+            {
+                "pricelist_id": self.pricelist.id,
+                "applied_on": "1_product",
+                "product_tmpl_id": self.product_template.id,
+                "min_quantity": 10,
+                "compute_price": "fixed",
+                "fixed_price": 90.0,
+                "date_start": tomorrow,
+            }
+        )
+        self.assertEqual(
+            self.variant_1._get_price_scale_multi(self.pricelist)[self.variant_1.id],
+            [],
+        )
+        self.assertEqual(
+            self.variant_1.with_context(date=tomorrow)._get_price_scale_multi(
+                self.pricelist
+            )[self.variant_1.id],
+            [(10, 90.0)],
+        )
@@ -0,0 +1,43 @@
+# Copyright 2026 Tecnativa - Carlos Roca
+# License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl).
+from odoo.tests import HttpCase, tagged
+
+
+@tagged("post_install", "-at_install")
+class TestGridInfoRendering(HttpCase):
+    def setUp(self):
+        super().setUp()
+        product_attribute = self.env["product.attribute"].create(
+            {"name": "Test rendering", "create_variant": "always"}
+        )
+        values = self.env["product.attribute.value"].create(
+            [
+                {"name": "Test rendering v1", "attribute_id": product_attribute.id},
+                {"name": "Test rendering v2", "attribute_id": product_attribute.id},
+            ]
+        )
+        template = self.env["product.template"].create(
+            {
+                "name": "Test minimal price rendering",
+                "is_published": True,
+                "list_price": 100.0,
+                "attribute_line_ids": [
+                    (
+                        0,
+                        0,
+                        {
+                            "attribute_id": product_attribute.id,
+                            "value_ids": [(6, 0, values.ids)],
+                        },
+                    )
+                ],
+            }
+        )
+        template.attribute_line_ids.product_template_value_ids[1].price_extra = 10.0
+        self.website = self.env["website"].get_current_website()
+        self.website.grid_info_server_side = True
+
+    def test_server_side_rendering(self):
+        html = self.url_open("/shop?search=Test minimal price rendering").text
+        self.assertIn('data-grid-info-rendered="1"', html)
+        self.assertIn("<span>From</span>", html)
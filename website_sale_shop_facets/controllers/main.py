@@ -0,0 +1,72 @@
+# Copyright 2026 Tecnativa - Carlos Roca
+# License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl).
+from odoo import http
+from odoo.http import request
+
+from odoo.addons.website_sale.controllers.main import WebsiteSale
+
+
+class WebsiteSale(WebsiteSale):
+    def _get_shop_request_cache(self):
+        """Cache of the shop searches done during the current request."""
+        cache = getattr(request, "website_sale_shop_cache", None)
+        if not isinstance(cache, dict):
+            cache = request.website_sale_shop_cache = {}
+        return cache
+
+    def _get_search_domain_cache_key(
+        self, search, category, attrib_values, search_in_description=True
+    ):
+        """Inputs of the shop search domain, the modules whose domain depends
+        on other values that can change during the request must add them.
+        """
+        return (
+            search or "",
+            category and int(category),
+            tuple(tuple(value) for value in attrib_values or []),
+            search_in_description,
+            request.website.id,
+            request.website.get_current_pricelist().id,
+        )
+
+    def _get_cached_search_domain(
+        self, search, category, attrib_values, search_in_description=True
+    ):
+        """Get the final shop search domain, with all the modules overrides,
+        computing it only once per request for the same inputs.
+        """
+        key = (
+            "domain",
+            self._get_search_domain_cache_key(
+                search, category, attrib_values, search_in_description
+            ),
+        )
+        cache = self._get_shop_request_cache()
+        if key not in cache:
+            cache[key] = self._get_search_domain(
+                search,
+                category,
+                attrib_values,
+                search_in_description=search_in_description,
+            )
+        # Return a copy, as some overrides change the domain in place
+        return list(cache[key])
+
+    def _get_cached_shop_facets(self, domain):
+        """Get the facets of the domain, computing them only once per request."""
+        key = ("facets", repr(domain))
+        cache = self._get_shop_request_cache()
+        if key not in cache:
+            cache[key] = request.env["product.template"]._get_shop_facets(domain)
+        return cache[key]
+
+    @http.route()
+    def shop(self, page=0, category=None, search="", ppg=False, **post):
+        res = super().shop(page=page, category=category, search=search, ppg=ppg, **post)
+        domain = self._get_cached_search_domain(
+            res.qcontext.get("search"),
+            res.qcontext.get("category"),
+            res.qcontext.get("attrib_values"),
+        )
+        res.qcontext["shop_facets"] = self._get_cached_shop_facets(domain)
+        return res
@@ -0,0 +1 @@
+from . import product_template
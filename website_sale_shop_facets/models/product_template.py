@@ -0,0 +1,76 @@
+# Copyright 2026 Tecnativa - Carlos Roca
+# License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl).
+from odoo import api, models
+
+
+class ProductTemplate(models.Model):
+    _inherit = "product.template"
+
+    @api.model
+    def _get_shop_facets_queries(self):
+        """Queries of the shop facets, joined with ``UNION ALL``.
+
+        Each query can use the ``shop_templates`` table with the ids of the
+        templates found, and must return the columns ``facet``, ``key``,
+        ``count``, ``min_value`` and ``max_value``.
+        """
+        value_field = self.env["product.template.attribute.line"]._fields["value_ids"]
+        return [
+            """
+            SELECT
+                'price' AS facet,
+                NULL::integer AS key,
+                count(*) AS count,
+                min(pt.list_price)::numeric AS min_value,
+                max(pt.list_price)::numeric AS max_value
+            FROM product_template pt
+            JOIN shop_templates st ON st.id = pt.id
+            """,
+            """
+            SELECT
+                'attribute_value',
+                rel.{value_column},
+                count(DISTINCT ptal.product_tmpl_id),
+                NULL::numeric,
+                NULL::numeric
+            FROM product_template_attribute_line ptal
+            JOIN shop_templates st ON st.id = ptal.product_tmpl_id
+            JOIN {relation} rel ON rel.{line_column} = ptal.id
+            WHERE ptal.active
+            GROUP BY rel.{value_column}
+            """.format(
+                relation=value_field.relation,
+                line_column=value_field.column1,
+                value_column=value_field.column2,
+            ),
+        ]
+
+    @api.model
+    def _get_shop_facets(self, domain):
+        """Compute the facets of the templates matching the domain in one query.
+
+        :return: dict mapping each facet to a dict. For facets grouped by a
+            record, like ``attribute_value``, it maps the record ids to the
+            number of templates. For the other ones, like ``price``, it has
+            the ``count``, ``min`` and ``max`` keys.
+        """
+        self.flush()
+        self.env["product.template.attribute.line"].flush()
+        subquery, params = self._search(domain).subselect()
+        self.env.cr.execute(
+            "WITH shop_templates AS ({}) {}".format(
+                subquery, " UNION ALL ".join(self._get_shop_facets_queries())
+            ),
+            params,
+        )
+        facets = {}
+        for facet, key, count, min_value, max_value in self.env.cr.fetchall():
+            if key is None:
+                facets.setdefault(facet, {}).update(
+                    count=count,
+                    min=min_value and float(min_value) or 0.0,
+                    max=max_value and float(max_value) or 0.0,
+                )
+            else:
+                facets.setdefault(facet, {})[key] = count
+        return facets
@@ -0,0 +1,88 @@
+# Copyright 2026 Tecnativa - Carlos Roca
+# License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl).
+from unittest.mock import patch
+
+from odoo.tests.common import SavepointCase
+
+from odoo.addons.website.tools import MockRequest
+from odoo.addons.website_sale_shop_facets.controllers.main import WebsiteSale
+
+
+class TestShopFacets(SavepointCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.product_attribute = cls.env["product.attribute"].create(
+            {"name": "Test facets", "create_variant": "no_variant"}
+        )
+        cls.value_red, cls.value_blue = cls.env["product.attribute.value"].create(
+            [
+                {"name": "Test red", "attribute_id": cls.product_attribute.id},
+                {"name": "Test blue", "attribute_id": cls.product_attribute.id},
+            ]
+        )
+        cls.template_1, cls.template_2 = cls.env["product.template"].create(
+            [
+                {
+                    "name": "Test facets 1",
+                    "list_price": 10.0,
+                    "attribute_line_ids": [
+                        (
+                            0,
+                            0,
+                            {
+                                "attribute_id": cls.product_attribute.id,
+                                "value_ids": [
+                                    (6, 0, (cls.value_red + cls.value_blue).ids)
+                                ],
+                            },
+                        )
+                    ],
+                },
+                {
+                    "name": "Test facets 2",
+                    "list_price": 30.0,
+                    "attribute_line_ids": [
+                        (
+                            0,
+                            0,
+                            {
+                                "attribute_id": cls.product_attribute.id,
+                                "value_ids": [(6, 0, cls.value_red.ids)],
+                            },
+                        )
+                    ],
+                },
+            ]
+        )
+
+    def test_shop_facets(self):
+        facets = self.env["product.template"]._get_shop_facets(
+            [("name", "=like", "Test facets %")]
+        )
+        self.assertEqual(facets["price"], {"count": 2, "min": 10.0, "max": 30.0})
+        self.assertEqual(
+            facets["attribute_value"], {self.value_red.id: 2, self.value_blue.id: 1}
+        )
+
+    def test_shop_facets_empty(self):
+        facets = self.env["product.template"]._get_shop_facets([("id", "=", 0)])
+        self.assertEqual(facets["price"], {"count": 0, "min": 0.0, "max": 0.0})
+        self.assertNotIn("attribute_value", facets)
+
+    def test_shop_request_cache(self):
+        controller = WebsiteSale()
+        website = self.env["website"].get_current_website()
+        with MockRequest(self.env, website=website):
+            with patch.object(
+                WebsiteSale, "_get_search_domain", return_value=[("id", "=", 0)]
+            ) as mock_search_domain:
+                domain = controller._get_cached_search_domain("", None, [])
+                domain.append(("id", "!=", 1))
+                self.assertEqual(
+                    controller._get_cached_search_domain("", None, []),
+                    [("id", "=", 0)],
+                )
+                self.assertEqual(mock_search_domain.call_count, 1)
+            facets = controller._get_cached_shop_facets([("id", "=", 0)])
+            self.assertIs(controller._get_cached_shop_facets([("id", "=", 0)]), facets)
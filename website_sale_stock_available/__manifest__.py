@@ -4,14 +4,14 @@
     "name": "Website Sale Stock Available",
     "summary": "Display 'Available to promise' in shop online "
     "instead 'Quantity On Hand'",
-    "version": "14.0.1.0.0",
+    "version": "14.0.1.1.0",
     "category": "Website",
     "website": "https://github.com/OCA/e-commerce",
     "author": "Tecnativa, Odoo Community Association (OCA)",
     "license": "AGPL-3",
     "depends": [
         "stock_available",
-        "website_sale_stock",
+        "website_sale_stock_snapshot",
     ],
     "data": [],
     "installable": True,
@@ -10,11 +10,22 @@ class Product(models.Model):
     def _compute_quantities_dict(
         self, lot_id, owner_id, package_id, from_date=False, to_date=False
     ):
-        res = super()._compute_quantities_dict(
-            lot_id, owner_id, package_id, from_date, to_date
+        if not self.env.context.get("website_sale_stock_available"):
+            return super()._compute_quantities_dict(
+                lot_id, owner_id, package_id, from_date, to_date
+            )
+        # Compute the quantities and the immediately usable ones of all the
+        # products in one pass. _compute_available_quantities_dict already
+        # returns the quantities it computes from, so don't compute them again.
+        products = self.with_context(
+            website_sale_stock_available=False,
+            lot_id=lot_id,
+            owner_id=owner_id,
+            package_id=package_id,
+            from_date=from_date,
+            to_date=to_date,
         )
-        if self.env.context.get("website_sale_stock_available"):
-            for product in self.with_context(website_sale_stock_available=False):
-                immediately = product.immediately_usable_qty
-                res[product.id]["virtual_available"] = immediately
+        available, res = products._compute_available_quantities_dict()
+        for product_id, values in available.items():
+            res[product_id]["virtual_available"] = values["immediately_usable_qty"]
         return res
@@ -89,3 +89,25 @@ class SaleStockAvailableInfoPopup(SavepointCase):
         self.assertEqual(
             combination_info["virtual_available"], self.product.immediately_usable_qty
         )
+
+    def test_compute_quantities_dict_batch(self):
+        products = self.product | self.env["product.product"].create(
+            [{"name": "Storable product %s" % i, "type": "product"} for i in range(5)]
+        )
+        for i, product in enumerate(products[1:], start=1):
+            self.env["stock.quant"].create(
+                {
+                    "product_id": product.id,
+                    "location_id": self.stock_location.id,
+                    "quantity": float(i),
+                }
+            )
+        self.picking_out.action_confirm()
+        res = products.with_context(
+            website_sale_stock_available=True
+        )._compute_quantities_dict(None, None, None)
+        for product in products:
+            self.assertEqual(
+                res[product.id]["virtual_available"], product.immediately_usable_qty
+            )
+            self.assertEqual(res[product.id]["qty_available"], product.qty_available)
@@ -5,12 +5,12 @@
 {
     "name": "Website Sale Stock List Preview",
     "summary": "Show the stock of products on the product previews",
-    "version": "14.0.1.0.0",
+    "version": "14.0.1.3.0",
     "category": "Website",
     "website": "https://github.com/OCA/e-commerce",
     "author": "Tecnativa, Odoo Community Association (OCA)",
     "license": "AGPL-3",
     "installable": True,
-    "depends": ["website_sale_stock"],
+    "depends": ["website_sale_product_grid_info", "website_sale_stock_snapshot"],
     "data": ["views/assets.xml", "views/templates.xml"],
 }
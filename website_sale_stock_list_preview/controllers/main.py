@@ -20,32 +20,10 @@ class WebsiteSaleVariantController(VariantController):
         """Special route to use website logic in get_combination_info override.
         This route is called in JS by appending _website to the base route.
         """
-
-        current_website = request.env["website"].get_current_website()
-        res = []
         templates = (
             request.env["product.template"]
             .sudo()
-            .with_context(warehouse=current_website.warehouse_id.id)
             .browse(product_template_ids)
+            .filtered(lambda t: t.is_published)
         )
-        for template in templates.filtered(lambda t: t.is_published):
-
-            res.append(
-                {
-                    "id": template.id,
-                    "virtual_available": template.virtual_available,
-                    "virtual_available_formatted": request.env[
-                        "ir.qweb.field.float"
-                    ].value_to_html(
-                        template.virtual_available,
-                        {"decimal_precision": "Product Unit of Measure"},
-                    ),
-                    "inventory_availability": template.inventory_availability,
-                    "available_threshold": template.available_threshold,
-                    "custom_message": template.custom_message,
-                    "type": template.type,
-                    "uom_name": template.uom_name,
-                }
-            )
-        return res
+        return templates._get_grid_info(["stock_preview"])["stock_preview"]
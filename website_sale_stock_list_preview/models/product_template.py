@@ -0,0 +1,66 @@
+# Copyright 2026 Tecnativa - Carlos Roca
+# License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl).
+from odoo import api, models
+from odoo.tools import float_round
+
+
+class ProductTemplate(models.Model):
+    _inherit = "product.template"
+
+    @api.model
+    def _get_grid_info_enrichers(self):
+        res = super()._get_grid_info_enrichers()
+        res["stock_preview"] = "_get_grid_info_stock_preview"
+        return res
+
+    @api.model
+    def _format_stock_preview_quantities(self, quantities):
+        """Format many quantities at once as ``ir.qweb.field.float`` does, but
+        getting the precision and the language only once.
+
+        :return: list with the formatted quantities.
+        """
+        precision = self.env["decimal.precision"].precision_get(
+            "Product Unit of Measure"
+        )
+        lang = self.env["ir.qweb.field"].user_lang()
+        fmt = "%.{}f".format(precision)
+        return [
+            lang.format(
+                fmt, float_round(quantity, precision_digits=precision), grouping=True
+            ).replace("-", "-\N{ZERO WIDTH NO-BREAK SPACE}")
+            for quantity in quantities
+        ]
+
+    def _get_grid_info_stock_preview(self, grid_context):
+        """Get the stock of the templates for the shop grid, computing the
+        quantities of all of them in one go.
+        """
+        templates = self.with_context(
+            warehouse=grid_context["website"].warehouse_id.id,
+            website_sale_stock_snapshot=True,
+        )
+        quantities = templates._compute_quantities_dict()
+        virtual_available = [
+            quantities[template.id]["virtual_available"] for template in templates
+        ]
+        formatted = self._format_stock_preview_quantities(virtual_available)
+        res = []
+        for template, qty, qty_formatted in zip(
+            templates, virtual_available, formatted
+        ):
+            values = {
+                "id": template.id,
+                "virtual_available": qty,
+                "virtual_available_formatted": qty_formatted,
+                "inventory_availability": template.inventory_availability,
+                "type": template.type,
+                "uom_name": template.uom_name,
+            }
+            # Only send the values that are used for the availability
+            if template.inventory_availability == "threshold":
+                values["available_threshold"] = template.available_threshold
+            elif template.inventory_availability == "custom":
+                values["custom_message"] = template.custom_message
+            res.append(values)
+        return res
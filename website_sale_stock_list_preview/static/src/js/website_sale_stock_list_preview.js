@@ -3,6 +3,9 @@ odoo.define("website_sale_stock_list_preview.shop_stock", function (require) {
 
     var publicWidget = require("web.public.widget");
     var core = require("web.core");
+    const GridInfo = require("website_sale_product_grid_info.grid_info");
+
+    GridInfo.register("stock_preview");
 
     publicWidget.registry.WebsiteSaleStockListPreview = publicWidget.Widget.extend({
         selector: "#products_grid",
@@ -11,22 +14,18 @@ odoo.define("website_sale_stock_list_preview.shop_stock", function (require) {
         ],
 
         start: function () {
+            if (GridInfo.isServerRendered()) {
+                return this._super.apply(this, arguments);
+            }
             return $.when.apply($, [
                 this._super.apply(this, arguments),
                 this.render_stock(),
             ]);
         },
         render_stock: function () {
-            const $products = $(".o_wsale_product_grid_wrapper");
-            const product_dic = {};
-            $products.each(function () {
-                product_dic[this.querySelector("a img").src.split("/")[6]] = this;
-            });
-            const product_ids = Object.keys(product_dic).map(Number);
-            return this._rpc({
-                route: "/sale/get_combination_info_stock_preview/",
-                params: {product_template_ids: product_ids},
-            }).then((products_qty) => {
+            const product_dic = GridInfo.getProductElements();
+            return GridInfo.load().then((grid_info) => {
+                const products_qty = grid_info.stock_preview || [];
                 for (const product of products_qty) {
                     $(product_dic[product.id])
                         .find(".product_price")
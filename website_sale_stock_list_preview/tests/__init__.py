@@ -1 +1,3 @@
 from . import test_ui
+from . import test_stock_preview
+from . import test_grid_info_rendering
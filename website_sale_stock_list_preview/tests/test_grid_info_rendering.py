@@ -0,0 +1,61 @@
+# Copyright 2026 Tecnativa - Carlos Roca
+# License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl).
+from odoo.tests import HttpCase, tagged
+
+
+@tagged("post_install", "-at_install")
+class TestGridInfoRendering(HttpCase):
+    def setUp(self):
+        super().setUp()
+        self.template_in_stock, self.template_out_of_stock = self.env[
+            "product.template"
+        ].create(
+            [
+                {
+                    "name": "Test stock rendering in stock",
+                    "is_published": True,
+                    "type": "product",
+                    "inventory_availability": "always",
+                },
+                {
+                    "name": "Test stock rendering out of stock",
+                    "is_published": True,
+                    "type": "product",
+                    "inventory_availability": "always",
+                },
+            ]
+        )
+        self.env["stock.quant"].create(
+            {
+                "product_id": self.template_in_stock.product_variant_id.id,
+                "location_id": self.env.ref("stock.stock_location_stock").id,
+                "quantity": 30.0,
+            }
+        )
+        self.env.ref("website_sale.products_add_to_cart").active = True
+        self.website = self.env["website"].get_current_website()
+
+    def _get_shop_html(self, search):
+        return self.url_open("/shop?search=%s" % search).text
+
+    def test_browser_side_rendering(self):
+        html = self._get_shop_html("Test stock rendering in stock")
+        # The button waits for the stock loaded from the browser
+        self.assertIn("a-submit disabled", html)
+        self.assertIn("fa-shopping-cart d-none", html)
+        self.assertIn("fa-spinner", html)
+
+    def test_server_side_rendering(self):
+        self.website.grid_info_server_side = True
+        html = self._get_shop_html("Test stock rendering in stock")
+        self.assertIn(
+            "availability_message_%s" % self.template_in_stock.id,
+            html,
+        )
+        self.assertIn("30.00", html)
+        self.assertNotIn("a-submit disabled", html)
+        self.assertNotIn("fa-spinner", html)
+        html = self._get_shop_html("Test stock rendering out of stock")
+        self.assertIn("Temporarily out of stock", html)
+        self.assertIn("a-submit disabled", html)
+        self.assertNotIn("fa-shopping-cart d-none", html)
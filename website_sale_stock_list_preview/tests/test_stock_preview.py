@@ -0,0 +1,43 @@
+# Copyright 2026 Tecnativa - Carlos Roca
+# License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl).
+from odoo.tests import SavepointCase, tagged
+
+
+@tagged("post_install", "-at_install")
+class TestStockPreview(SavepointCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.templates = cls.env["product.template"].create(
+            [
+                {
+                    "name": "Test stock preview 1",
+                    "type": "product",
+                    "inventory_availability": "always",
+                },
+                {
+                    "name": "Test stock preview 2",
+                    "type": "product",
+                    "inventory_availability": "threshold",
+                    "available_threshold": 5,
+                },
+            ]
+        )
+        cls.env["stock.quant"].create(
+            {
+                "product_id": cls.templates[0].product_variant_id.id,
+                "location_id": cls.env.ref("stock.stock_location_stock").id,
+                "quantity": 30.0,
+            }
+        )
+        cls.website = cls.env["website"].get_current_website()
+
+    def test_stock_preview(self):
+        res = self.templates._get_grid_info_stock_preview({"website": self.website})
+        self.assertEqual(len(res), 2)
+        self.assertEqual(res[0]["id"], self.templates[0].id)
+        self.assertEqual(res[0]["virtual_available"], 30.0)
+        self.assertEqual(res[0]["virtual_available_formatted"], "30.00")
+        self.assertNotIn("available_threshold", res[0])
+        self.assertEqual(res[1]["virtual_available"], 0.0)
+        self.assertEqual(res[1]["available_threshold"], 5)
@@ -3,7 +3,7 @@
 {
     "name": "Website Sale Stock Provisioning Date",
     "summary": "Display provisioning date for a product in shop online",
-    "version": "14.0.1.0.0",
+    "version": "14.0.1.2.0",
     "development_status": "Beta",
     "category": "Website",
     "website": "https://github.com/OCA/e-commerce",
@@ -12,5 +12,10 @@
     "application": False,
     "installable": True,
     "depends": ["website_sale_stock"],
-    "data": ["views/assets.xml", "views/product_template_views.xml"],
+    "data": [
+        "security/ir.model.access.csv",
+        "data/ir_cron.xml",
+        "views/assets.xml",
+        "views/product_template_views.xml",
+    ],
 }
@@ -1,3 +1,5 @@
 # License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl).
 from . import product_product
+from . import product_provisioning_date
 from . import product_template
+from . import stock_move
@@ -1,19 +1,27 @@
 # Copyright 2019 Tecnativa - Ernesto Tejeda
 # License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl).
-from odoo import fields, models
+from odoo import models
 
 
 class ProductProduct(models.Model):
     _inherit = "product.product"
 
     def _get_next_provisioning_date(self, company):
-        domain = [
-            ("company_id", "=", company.id),
-            ("product_id", "in", self.ids),
-            ("state", "not in", ["draft", "done", "cancel"]),
-            ("location_id.usage", "=", "supplier"),
-            ("location_dest_id.usage", "=", "internal"),
-            ("date", ">=", fields.Datetime.now()),
+        dates = [
+            date
+            for date in self._get_next_provisioning_date_multi(company).values()
+            if date
         ]
-        move = self.env["stock.move"].sudo().search(domain, order="date", limit=1)
-        return move and move.date.date() or False
+        return dates and min(dates) or False
+
+    def _get_next_provisioning_date_multi(self, company):
+        """Get the next provisioning date of many products at once.
+
+        :return: dict mapping the product ids to their next provisioning date,
+            or False if there isn't any.
+        """
+        return (
+            self.env["product.provisioning.date"]
+            .sudo()
+            ._get_provisioning_dates(self, company)
+        )
@@ -0,0 +1,162 @@
+# Copyright 2026 Tecnativa - Carlos Roca
+# License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl).
+from odoo import api, fields, models
+
+
+class ProductProvisioningDate(models.Model):
+    _name = "product.provisioning.date"
+    _description = "Next provisioning date of the products by company"
+    _log_access = False
+
+    company_id = fields.Many2one(
+        comodel_name="res.company",
+        required=True,
+        ondelete="cascade",
+    )
+    product_id = fields.Many2one(
+        comodel_name="product.product",
+        required=True,
+        ondelete="cascade",
+        index=True,
+    )
+    date = fields.Datetime(required=True)
+
+    _sql_constraints = [
+        (
+            "company_product_uniq",
+            "unique(company_id, product_id)",
+            "Only one provisioning date by product and company is allowed.",
+        )
+    ]
+
+    @api.model
+    def _get_provisioning_dates(self, products, company):
+        """Get the next provisioning date of the products from the stored ones.
+
+        The stored dates that already passed are looked up again in the moves
+        until the cron refreshes them, they are never written from the shop
+        pages.
+
+        :return: dict mapping the product ids to their next provisioning date,
+            or False if there isn't any.
+        """
+        res = dict.fromkeys(products.ids, False)
+        if not products:
+            return res
+        now = fields.Datetime.now()
+        expired_ids = []
+        for product_id, date in self._read_provisioning_dates(products, company):
+            if date >= now:
+                res[product_id] = date.date()
+            else:
+                expired_ids.append(product_id)
+        if expired_ids:
+            self._flush_provisioning_moves()
+            self.env.cr.execute(
+                self._get_next_dates_query(
+                    "AND sm.company_id = %(company_id)s "
+                    "AND sm.product_id IN %(product_ids)s"
+                ),
+                {
+                    "now": now,
+                    "company_id": company.id,
+                    "product_ids": tuple(expired_ids),
+                },
+            )
+            for __, product_id, date in self.env.cr.fetchall():
+                res[product_id] = date.date()
+        return res
+
+    @api.model
+    def _read_provisioning_dates(self, products, company):
+        self.flush()
+        self.env.cr.execute(
+            """
+            SELECT product_id, date
+            FROM product_provisioning_date
+            WHERE company_id = %s AND product_id IN %s
+            """,
+            (company.id, tuple(products.ids)),
+        )
+        return self.env.cr.fetchall()
+
+    @api.model
+    def _flush_provisioning_moves(self):
+        self.env["stock.move"].flush(
+            [
+                "company_id",
+                "product_id",
+                "state",
+                "date",
+                "location_id",
+                "location_dest_id",
+            ]
+        )
+        self.env["stock.location"].flush(["usage"])
+
+    @api.model
+    def _get_next_dates_query(self, move_where=""):
+        """Query of the date of the next incoming supplier move of the products
+        for each company, after the ``now`` parameter.
+        """
+        return """
+            SELECT DISTINCT ON (sm.company_id, sm.product_id)
+                sm.company_id, sm.product_id, sm.date
+            FROM stock_move sm
+            JOIN stock_location sl ON sl.id = sm.location_id
+            JOIN stock_location sld ON sld.id = sm.location_dest_id
+            WHERE sm.state NOT IN ('draft', 'done', 'cancel')
+                AND sm.date >= %(now)s
+                AND sl.usage = 'supplier'
+                AND sld.usage = 'internal'
+                {move_where}
+            ORDER BY sm.company_id, sm.product_id, sm.date
+        """.format(
+            move_where=move_where
+        )
+
+    @api.model
+    def _refresh_provisioning_dates(self, products=None):
+        """Store the date of the next incoming supplier move of the products
+        for each company.
+
+        The dates are upserted and only the rows without pending moves are
+        deleted, so concurrent refreshes of the same products don't conflict.
+
+        :param products: products to refresh, all of them by default.
+        """
+        self._flush_provisioning_moves()
+        move_where = ppd_where = ""
+        params = {"now": fields.Datetime.now()}
+        if products is not None:
+            if not products:
+                return
+            move_where = "AND sm.product_id IN %(product_ids)s"
+            ppd_where = "AND ppd.product_id IN %(product_ids)s"
+            params["product_ids"] = tuple(products.ids)
+        self.env.cr.execute(
+            """
+            WITH next_dates AS ({next_dates}), deleted AS (
+                DELETE FROM product_provisioning_date ppd
+                WHERE NOT EXISTS (
+                    SELECT 1
+                    FROM next_dates nd
+                    WHERE nd.company_id = ppd.company_id
+                        AND nd.product_id = ppd.product_id
+                ) {ppd_where}
+            )
+            INSERT INTO product_provisioning_date (company_id, product_id, date)
+            SELECT company_id, product_id, date FROM next_dates
+            ON CONFLICT (company_id, product_id) DO UPDATE
+                SET date = EXCLUDED.date
+                WHERE product_provisioning_date.date IS DISTINCT FROM EXCLUDED.date
+            """.format(
+                next_dates=self._get_next_dates_query(move_where), ppd_where=ppd_where
+            ),
+            params,
+        )
+        self.invalidate_cache()
+
+    @api.model
+    def _cron_refresh_provisioning_dates(self):
+        self._refresh_provisioning_dates()
@@ -17,6 +17,24 @@ class ProductTemplate(models.Model):
     def _get_next_provisioning_date(self, company):
         return self.product_variant_ids._get_next_provisioning_date(company)
 
+    def _get_next_provisioning_date_multi(self, company):
+        """Get the next provisioning date of many templates at once, for
+        example for the products of the shop listing.
+
+        :return: dict mapping the template ids to the nearest provisioning
+            date of their variants, or False if there isn't any.
+        """
+        dates = self.product_variant_ids._get_next_provisioning_date_multi(company)
+        res = {}
+        for template in self:
+            variant_dates = [
+                dates[variant.id]
+                for variant in template.product_variant_ids
+                if dates[variant.id]
+            ]
+            res[template.id] = variant_dates and min(variant_dates) or False
+        return res
+
     def _get_combination_info(
         self,
         combination=False,
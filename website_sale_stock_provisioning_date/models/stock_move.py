@@ -0,0 +1,59 @@
+# Copyright 2026 Tecnativa - Carlos Roca
+# License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl).
+from odoo import api, models, tools
+
+
+class StockMove(models.Model):
+    _inherit = "stock.move"
+
+    def init(self):
+        # Partial index for refreshing the next provisioning dates, which only
+        # look for the pending moves of the products
+        index_name = "stock_move_provisioning_date_index"
+        if not tools.index_exists(self._cr, index_name):
+            self._cr.execute(
+                """
+                CREATE INDEX {} ON {} (product_id, date)
+                WHERE state NOT IN ('draft', 'done', 'cancel')
+                """.format(
+                    index_name, self._table
+                )
+            )
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        moves = super().create(vals_list)
+        moves._refresh_provisioning_dates()
+        return moves
+
+    def write(self, vals):
+        if not set(vals) & set(self._get_provisioning_date_dependencies()):
+            return super().write(vals)
+        products = self._get_provisioning_date_products()
+        res = super().write(vals)
+        products |= self._get_provisioning_date_products()
+        self.env["product.provisioning.date"].sudo()._refresh_provisioning_dates(
+            products
+        )
+        return res
+
+    def _get_provisioning_date_dependencies(self):
+        """Fields of the moves that change the next provisioning date."""
+        return [
+            "state",
+            "date",
+            "product_id",
+            "company_id",
+            "location_id",
+            "location_dest_id",
+        ]
+
+    def _get_provisioning_date_products(self):
+        """Products of the incoming supplier moves."""
+        return self.filtered(lambda m: m.location_id.usage == "supplier").product_id
+
+    def _refresh_provisioning_dates(self):
+        """Refresh the stored next provisioning date of the moves products."""
+        self.env["product.provisioning.date"].sudo()._refresh_provisioning_dates(
+            self._get_provisioning_date_products()
+        )
@@ -1,2 +1,3 @@
 # License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl).
 from . import test_website_sale_stock_provisioning_date
+from . import test_next_provisioning_date
@@ -0,0 +1,114 @@
+# Copyright 2026 Tecnativa - Carlos Roca
+# License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl).
+from datetime import timedelta
+
+from odoo import fields
+from odoo.tests import SavepointCase
+
+
+class TestNextProvisioningDate(SavepointCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.company = cls.env.company
+        cls.products = cls.env["product.product"].create(
+            [
+                {"name": "Test provisioning date 1", "type": "product"},
+                {"name": "Test provisioning date 2", "type": "product"},
+            ]
+        )
+        cls.supplier_location = cls.env.ref("stock.stock_location_suppliers")
+        cls.stock_location = cls.env.ref("stock.stock_location_stock")
+        now = fields.Datetime.now()
+        cls.moves = cls.env["stock.move"].create(
+            [
+                cls._prepare_move_vals(cls.products[0], now + timedelta(days=5)),
+                cls._prepare_move_vals(cls.products[0], now + timedelta(days=2)),
+            ]
+        )
+        cls.moves._action_confirm()
+
+    @classmethod
+    def _prepare_move_vals(cls, product, date):
+        return {
+            "name": product.name,
+            "product_id": product.id,
+            "product_uom_qty": 10.0,
+            "product_uom": product.uom_id.id,
+            "location_id": cls.supplier_location.id,
+            "location_dest_id": cls.stock_location.id,
+            "company_id": cls.company.id,
+            "date": date,
+        }
+
+    def test_next_provisioning_date_multi(self):
+        res = self.products._get_next_provisioning_date_multi(self.company)
+        self.assertEqual(
+            res,
+            {
+                self.products[0].id: min(self.moves.mapped("date")).date(),
+                self.products[1].id: False,
+            },
+        )
+        self.assertEqual(
+            self.products[0].product_tmpl_id._get_next_provisioning_date(self.company),
+            res[self.products[0].id],
+        )
+
+    def test_provisioning_date_refresh(self):
+        stored = self.env["product.provisioning.date"].search(
+            [("product_id", "in", self.products.ids)]
+        )
+        self.assertEqual(stored.product_id, self.products[0])
+        self.assertEqual(stored.date, min(self.moves.mapped("date")))
+        first_move = self.moves.sorted("date")[0]
+        first_move._action_cancel()
+        self.assertEqual(
+            self.products._get_next_provisioning_date_multi(self.company)[
+                self.products[0].id
+            ],
+            (self.moves - first_move).date.date(),
+        )
+        (self.moves - first_move).write(
+            {"date": fields.Datetime.now() + timedelta(days=1)}
+        )
+        self.assertEqual(
+            self.products[0]._get_next_provisioning_date(self.company),
+            (self.moves - first_move).date.date(),
+        )
+
+    def test_provisioning_date_upsert(self):
+        ProvisioningDate = self.env["product.provisioning.date"]
+        stored = ProvisioningDate.search([("product_id", "=", self.products[0].id)])
+        new_date = fields.Datetime.now() + timedelta(days=1)
+        self.env.cr.execute(
+            "UPDATE stock_move SET date = %s WHERE id IN %s",
+            (new_date, tuple(self.moves.ids)),
+        )
+        self.moves.invalidate_cache(["date"])
+        ProvisioningDate._refresh_provisioning_dates(self.products)
+        ProvisioningDate._refresh_provisioning_dates()
+        # The row is updated in place instead of deleted and inserted again
+        self.assertEqual(
+            ProvisioningDate.search([("product_id", "in", self.products.ids)]),
+            stored,
+        )
+        self.assertEqual(stored.date, new_date.replace(microsecond=0))
+
+    def test_provisioning_date_past(self):
+        ProvisioningDate = self.env["product.provisioning.date"]
+        stored = ProvisioningDate.search([("product_id", "=", self.products[0].id)])
+        # The first move date passed before the cron refreshed the stored one
+        past_date = fields.Datetime.now().replace(microsecond=0) - timedelta(days=1)
+        first_move = self.moves.sorted("date")[0]
+        self.env.cr.execute(
+            "UPDATE stock_move SET date = %s WHERE id = %s", (past_date, first_move.id)
+        )
+        self.moves.invalidate_cache(["date"])
+        stored.date = past_date
+        self.assertEqual(
+            self.products[0]._get_next_provisioning_date(self.company),
+            (self.moves - first_move).date.date(),
+        )
+        # Reading the dates doesn't write them
+        self.assertEqual(stored.date, past_date)
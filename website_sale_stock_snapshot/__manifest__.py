@@ -0,0 +1,16 @@
+# Copyright 2026 Tecnativa - Carlos Roca
+# License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl).
+{
+    "name": "Website Sale Stock Snapshot",
+    "summary": "Cache the stock availability shown in the shop for a few seconds",
+    "version": "14.0.1.0.0",
+    "development_status": "Beta",
+    "category": "Website",
+    "website": "https://github.com/OCA/e-commerce",
+    "author": "Tecnativa, Odoo Community Association (OCA)",
+    "license": "AGPL-3",
+    "application": False,
+    "installable": True,
+    "depends": ["website_sale_stock"],
+    "data": ["views/res_config_settings_views.xml"],
+}
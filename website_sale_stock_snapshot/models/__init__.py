@@ -0,0 +1,5 @@
+from . import product_product
+from . import product_template
+from . import res_config_settings
+from . import stock_move
+from . import stock_quant
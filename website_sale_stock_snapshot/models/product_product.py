@@ -0,0 +1,146 @@
+# Copyright 2026 Tecnativa - Carlos Roca
+# License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl).
+import threading
+import time
+
+from odoo import api, models
+from odoo.tools.lru import LRU
+
+# Bounds of the snapshot of each worker: number of stock contexts, and number
+# of products by stock context.
+STOCK_SNAPSHOT_MAX_KEYS = 64
+STOCK_SNAPSHOT_MAX_PRODUCTS = 10000
+# The snapshot is shared by the threads of the worker
+STOCK_SNAPSHOT_LOCK = threading.Lock()
+
+
+class ProductProduct(models.Model):
+    _inherit = "product.product"
+
+    @api.depends("stock_move_ids.product_qty", "stock_move_ids.state")
+    @api.depends_context(
+        "company",
+        "lot_id",
+        "owner_id",
+        "package_id",
+        "from_date",
+        "to_date",
+        "location",
+        "warehouse",
+        "website_sale_stock_snapshot",
+    )
+    def _compute_quantities(self):
+        # Don't share the cached quantities of the snapshot with the live ones
+        return super()._compute_quantities()
+
+    def _compute_quantities_dict(
+        self, lot_id, owner_id, package_id, from_date=False, to_date=False
+    ):
+        ttl = (
+            self.env.context.get("website_sale_stock_snapshot")
+            and self._get_stock_snapshot_ttl()
+        )
+        if (
+            not ttl
+            or not all(self.ids)
+            or any((lot_id, owner_id, package_id, from_date, to_date))
+        ):
+            return super()._compute_quantities_dict(
+                lot_id, owner_id, package_id, from_date, to_date
+            )
+        store = self._get_stock_snapshot_store()
+        key = self._get_stock_snapshot_key()
+        now = time.monotonic()
+        res = {}
+        with STOCK_SNAPSHOT_LOCK:
+            snapshot = store.get(key) or {}
+            for product_id in self.ids:
+                timestamp, values = snapshot.get(product_id, (0, None))
+                if values is not None and now - timestamp < ttl:
+                    res[product_id] = dict(values)
+        missing = self.filtered(lambda p: p.id not in res)
+        if missing:
+            missing_res = super(ProductProduct, missing)._compute_quantities_dict(
+                lot_id, owner_id, package_id, from_date, to_date
+            )
+            self._store_stock_snapshot(key, now, missing_res)
+            res.update(missing_res)
+        return res
+
+    @api.model
+    def _store_stock_snapshot(self, key, timestamp, quantities):
+        """Save the quantities in the snapshot once the transaction is
+        committed, the ones read in a transaction rolled back are never shared.
+        """
+        store = self._get_stock_snapshot_store()
+        quantities = {
+            product_id: dict(values) for product_id, values in quantities.items()
+        }
+
+        def store_snapshot():
+            with STOCK_SNAPSHOT_LOCK:
+                snapshot = store.get(key)
+                if snapshot is None:
+                    snapshot = store[key] = LRU(STOCK_SNAPSHOT_MAX_PRODUCTS)
+                for product_id, values in quantities.items():
+                    snapshot[product_id] = (timestamp, values)
+
+        self.env.cr.postcommit.add(store_snapshot)
+
+    @api.model
+    def _get_stock_snapshot_ttl(self):
+        """Seconds that the quantities of the snapshot are valid, 0 when the
+        snapshot is disabled.
+        """
+        return int(
+            self.env["ir.config_parameter"]
+            .sudo()
+            .get_param("website_sale_stock_snapshot.ttl", "0")
+        )
+
+    @api.model
+    def _get_stock_snapshot_store(self):
+        """Snapshot of the quantities of the products, shared by all the
+        requests of this worker for the current database.
+
+        Both the stock contexts and the products of each one are bounded, the
+        least recently used ones being discarded first.
+
+        :return: LRU mapping the snapshot keys to LRUs mapping product ids to
+            ``(timestamp, quantities)``.
+        """
+        store = getattr(self.pool, "_website_sale_stock_snapshot", None)
+        if store is None:
+            store = self.pool._website_sale_stock_snapshot = LRU(
+                STOCK_SNAPSHOT_MAX_KEYS
+            )
+        return store
+
+    @api.model
+    def _get_stock_snapshot_key(self):
+        """Context values that change the quantities of the products."""
+        return (
+            self.env.company.id,
+            tuple(sorted(self.env.companies.ids)),
+            repr(self.env.context.get("warehouse")),
+            repr(self.env.context.get("location")),
+        )
+
+    def _invalidate_stock_snapshot(self):
+        """Discard the snapshot of the products, now and once the transaction
+        is committed, as the other transactions may save the previous
+        quantities meanwhile.
+        """
+        store = self._get_stock_snapshot_store()
+        product_ids = set(self.ids)
+
+        def invalidate_snapshot():
+            with STOCK_SNAPSHOT_LOCK:
+                for key in list(store.keys()):
+                    snapshot = store.get(key) or {}
+                    for product_id in product_ids:
+                        if product_id in snapshot:
+                            snapshot[product_id] = (0, None)
+
+        invalidate_snapshot()
+        self.env.cr.postcommit.add(invalidate_snapshot)
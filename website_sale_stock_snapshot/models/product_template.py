@@ -0,0 +1,43 @@
+# Copyright 2026 Tecnativa - Carlos Roca
+# License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl).
+from odoo import api, models
+
+
+class ProductTemplate(models.Model):
+    _inherit = "product.template"
+
+    @api.depends(
+        "product_variant_ids",
+        "product_variant_ids.stock_move_ids.product_qty",
+        "product_variant_ids.stock_move_ids.state",
+    )
+    @api.depends_context(
+        "company", "location", "warehouse", "website_sale_stock_snapshot"
+    )
+    def _compute_quantities(self):
+        # Don't share the cached quantities of the snapshot with the live ones
+        return super()._compute_quantities()
+
+    def _get_combination_info(
+        self,
+        combination=False,
+        product_id=False,
+        add_qty=1,
+        pricelist=False,
+        parent_combination=False,
+        only_template=False,
+    ):
+        template = self
+        if (
+            self.env.context.get("website_id")
+            and self.env["product.product"]._get_stock_snapshot_ttl()
+        ):
+            template = self.with_context(website_sale_stock_snapshot=True)
+        return super(ProductTemplate, template)._get_combination_info(
+            combination,
+            product_id,
+            add_qty,
+            pricelist,
+            parent_combination,
+            only_template,
+        )
@@ -0,0 +1,15 @@
+# Copyright 2026 Tecnativa - Carlos Roca
+# License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl).
+from odoo import fields, models
+
+
+class ResConfigSettings(models.TransientModel):
+    _inherit = "res.config.settings"
+
+    website_stock_snapshot_ttl = fields.Integer(
+        string="Stock Snapshot",
+        config_parameter="website_sale_stock_snapshot.ttl",
+        default=0,
+        help="Seconds that the stock shown in the shop is kept before reading "
+        "it again. Keep it to 0 for always reading the current stock.",
+    )
@@ -0,0 +1,32 @@
+# Copyright 2026 Tecnativa - Carlos Roca
+# License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl).
+from odoo import api, models
+
+
+class StockMove(models.Model):
+    _inherit = "stock.move"
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        moves = super().create(vals_list)
+        moves.product_id._invalidate_stock_snapshot()
+        return moves
+
+    def write(self, vals):
+        products = self.product_id
+        res = super().write(vals)
+        if set(vals) & set(self._get_stock_snapshot_dependencies()):
+            products |= self.product_id
+            products._invalidate_stock_snapshot()
+        return res
+
+    def _get_stock_snapshot_dependencies(self):
+        """Fields of the moves that change the quantities of the products."""
+        return [
+            "state",
+            "product_id",
+            "product_uom_qty",
+            "product_uom",
+            "location_id",
+            "location_dest_id",
+        ]
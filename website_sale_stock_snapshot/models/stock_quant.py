@@ -0,0 +1,25 @@
+# Copyright 2026 Tecnativa - Carlos Roca
+# License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl).
+from odoo import api, models
+
+
+class StockQuant(models.Model):
+    _inherit = "stock.quant"
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        quants = super().create(vals_list)
+        quants.product_id._invalidate_stock_snapshot()
+        return quants
+
+    def write(self, vals):
+        res = super().write(vals)
+        if "quantity" in vals or "location_id" in vals:
+            self.product_id._invalidate_stock_snapshot()
+        return res
+
+    def unlink(self):
+        products = self.product_id
+        res = super().unlink()
+        products._invalidate_stock_snapshot()
+        return res
@@ -0,0 +1,74 @@
+# Copyright 2026 Tecnativa - Carlos Roca
+# License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl).
+from odoo.tests import SavepointCase
+
+
+class TestStockSnapshot(SavepointCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.product = cls.env["product.product"].create(
+            {"name": "Test stock snapshot", "type": "product"}
+        )
+        cls.stock_location = cls.env.ref("stock.stock_location_stock")
+        cls.env["stock.quant"]._update_available_quantity(
+            cls.product, cls.stock_location, 10.0
+        )
+        cls.env["ir.config_parameter"].sudo().set_param(
+            "website_sale_stock_snapshot.ttl", "60"
+        )
+
+    def _get_snapshot_qty(self):
+        product = self.product.with_context(website_sale_stock_snapshot=True)
+        return product._compute_quantities_dict(None, None, None)[product.id][
+            "virtual_available"
+        ]
+
+    def test_snapshot_invalidation(self):
+        self.assertEqual(self._get_snapshot_qty(), 10.0)
+        # Saved once the transaction is committed
+        self.env.cr.postcommit.run()
+        snapshot = self.product._get_stock_snapshot_store()[
+            self.product._get_stock_snapshot_key()
+        ]
+        self.assertIn(self.product.id, snapshot)
+        self.env["stock.quant"]._update_available_quantity(
+            self.product, self.stock_location, 5.0
+        )
+        self.assertIsNone(snapshot[self.product.id][1])
+        self.assertEqual(self._get_snapshot_qty(), 15.0)
+
+    def test_snapshot_rollback(self):
+        self.product._invalidate_stock_snapshot()
+        self.env.cr.postcommit.run()
+        self.assertEqual(self._get_snapshot_qty(), 10.0)
+        # The quantities read in a transaction rolled back are discarded
+        self.env.cr.postcommit.clear()
+        snapshot = self.product._get_stock_snapshot_store().get(
+            self.product._get_stock_snapshot_key(), {}
+        )
+        self.assertIsNone(snapshot.get(self.product.id, (0, None))[1])
+
+    def test_snapshot_disabled(self):
+        # Disabled by default
+        self.env["ir.config_parameter"].sudo().set_param(
+            "website_sale_stock_snapshot.ttl", False
+        )
+        self.assertEqual(self.product._get_stock_snapshot_ttl(), 0)
+        self.product._invalidate_stock_snapshot()
+        self.assertEqual(self._get_snapshot_qty(), 10.0)
+        snapshot = self.product._get_stock_snapshot_store().get(
+            self.product._get_stock_snapshot_key(), {}
+        )
+        self.assertNotIn(self.product.id, snapshot)
+
+    def test_snapshot_key_companies(self):
+        company_2 = self.env["res.company"].create({"name": "Test snapshot company"})
+        self.env.user.company_ids |= company_2
+        companies = self.env.company + company_2
+        self.assertNotEqual(
+            self.product._get_stock_snapshot_key(),
+            self.product.with_context(
+                allowed_company_ids=companies.ids
+            )._get_stock_snapshot_key(),
+        )